@@ -6,15 +6,21 @@ específicas de coeficientes c1 y c2, así como las estrategias básicas del sis
 """
 
 import os
+import argparse
+import atexit
 import json
-import subprocess
-import tempfile
+import multiprocessing
+import random
 import signal
+import subprocess
 import sys
+import tempfile
 import threading
 import queue
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Dict, Any, Tuple
+from types import MappingProxyType
+from typing import List, Dict, Any, Optional, Tuple
 from colorama import Fore, Style, init
 
 # Inicializar colorama
@@ -23,179 +29,79 @@ init(autoreset=True)
 BENCHMARKS = ["sphere", "rastrigin", "rosenbrock", "griewank"]
 DIMENSIONS = [10, 20, 30]
 
+# Configuración común a todas las estrategias (plantilla de solo lectura)
+_BASE = MappingProxyType({
+    "population_size": 100,
+    "generations": 100,
+    "multi_run_visualization": True
+})
+
+# Coeficientes variables en el tiempo usados por varias estrategias
+_CP = [0.5, 2.5, "linear_decreasing"]  # c_p: 2.5 → 0.5
+_CG = [0.5, 2.5, "linear_increasing"]  # c_g: 0.5 → 2.5
+
+
+def _mk(inertia_config: List[Any], c1: Any, c2: Any, description: str,
+        **overrides: Any) -> Dict[str, Any]:
+    """Crea la entrada de una estrategia a partir de la configuración común.
+
+    Args:
+        inertia_config (List[Any]): Configuración del peso inercial.
+        c1 (Any): Configuración del coeficiente cognitivo.
+        c2 (Any): Configuración del coeficiente social.
+        description (str): Descripción de la estrategia.
+        **overrides (Any): Parámetros que sustituyen a los de _BASE.
+
+    Returns:
+        Dict[str, Any]: Entrada de la estrategia para STRATEGIES, con la 
+            configuración como plantilla de solo lectura.
+    """
+    return {
+        "inertia_config": inertia_config,
+        "c1": c1,
+        "c2": c2,
+        "description": description,
+        "config": MappingProxyType({**_BASE, **overrides}),
+    }
+
+
 # Estrategias avanzadas con sus configuraciones específicas según strategy_inertia.tex
 STRATEGIES = {
     # Estrategias avanzadas originales
-    "linear_decreasing": {
-        "inertia_config": [0.4, 0.9, "linear_decreasing"],
-        "c1": 2,
-        "c2": 2,
-        "description": "PSO-LDIW (Linear Decreasing Inertia Weight)",
-        # Configuración específica para esta estrategia
-        "config": {
-            "population_size": 100,
-            "generations": 100,
-            "multi_run_visualization": True
-        }
-    },
-    "pso_niew": {
-        "inertia_config": [0.4, 0.9, "pso_niew"],
-        "c1": 2.0,
-        "c2": 2.0,
-        "description": "PSO-NIEW (Non-linear Exponential Inertia Weight)",
-        "config": {
-            "population_size": 100,
-            "generations": 100,
-            "multi_run_visualization": True
-        }
-    },
-    "pso_siw": {
-        "inertia_config": [0.4, 0.5, "pso_siw", 2.0],  # w_min, w_max, strategy, s
-        "c1": 2.0,
-        "c2": 2.0,
-        "description": "PSO-SIW (Sigmoidal Inertia Weight)",
-        "config": {
-            "population_size": 100,
-            "generations": 100,
-            "multi_run_visualization": True
-        }
-    },
-    "de_pso": {
-        "inertia_config": [0.4, 0.8, "de_pso"],
-        "c1": 2.8,
-        "c2": 1.3,
-        "description": "DE-PSO (Differential Evolution - PSO)",
-        "config": {
-            "population_size": 100,
-            "generations": 100,
-            "multi_run_visualization": True
-        }
-    },
-    "gpso": {
-        "inertia_config": [0.5, 0.9, "gpso"],
-        "c1": 2.0,
-        "c2": 2.0,
-        "description": "GPSO (Global PSO)",
-        "config": {
-            "population_size": 100,
-            "generations": 100,
-            "multi_run_visualization": True
-        }
-    },
-    "pso_tvac": {
-        "inertia_config": [0.4, 0.9, "pso_tvac"],
-        "c1": [0.5, 2.5, "linear_decreasing"],  # 2.5 → 0.5
-        "c2": [0.5, 2.5, "linear_increasing"],  # 0.5 → 2.5
-        "description": "PSO-TVAC (Time Varying Acceleration Coefficients)",
-        "config": {
-            "population_size": 100,
-            "generations": 100,
-            "multi_run_visualization": True
-        }
-    },
-    "dsi_pso": {
-        "inertia_config": [0.2, 0.8, "dsi_pso", 0.5],  # w_f, w_i, strategy, sensitivity
-        "c1": [0.5, 2.5, "linear_decreasing"],  # c_p: 2.5 → 0.5
-        "c2": [0.5, 2.5, "linear_increasing"],  # c_g: 0.5 → 2.5
-        "description": "PSO con DSI (Distance-dependent Sigmoidal Inertia)",
-        "config": {
-            "population_size": 100,
-            "generations": 100,
-            "multi_run_visualization": True
-        }
-    },
+    "linear_decreasing": _mk([0.4, 0.9, "linear_decreasing"], 2, 2,
+                             "PSO-LDIW (Linear Decreasing Inertia Weight)"),
+    "pso_niew": _mk([0.4, 0.9, "pso_niew"], 2.0, 2.0,
+                    "PSO-NIEW (Non-linear Exponential Inertia Weight)"),
+    "pso_siw": _mk([0.4, 0.5, "pso_siw", 2.0], 2.0, 2.0,  # w_min, w_max, strategy, s
+                   "PSO-SIW (Sigmoidal Inertia Weight)"),
+    "de_pso": _mk([0.4, 0.8, "de_pso"], 2.8, 1.3,
+                  "DE-PSO (Differential Evolution - PSO)"),
+    "gpso": _mk([0.5, 0.9, "gpso"], 2.0, 2.0,
+                "GPSO (Global PSO)"),
+    "pso_tvac": _mk([0.4, 0.9, "pso_tvac"], _CP, _CG,
+                    "PSO-TVAC (Time Varying Acceleration Coefficients)"),
+    "dsi_pso": _mk([0.2, 0.8, "dsi_pso", 0.5], _CP, _CG,  # w_f, w_i, strategy, sensitivity
+                   "PSO con DSI (Distance-dependent Sigmoidal Inertia)"),
 
     # Nueva estrategia híbrida propuesta
-    "hybrid_cosine": {
-        "inertia_config": [0.4, 0.9, "hybrid_cosine", "linear_decreasing", "SEP", "convex_decreasing"],
-        "c1": [0.5, 2.5, "linear_decreasing"],  # c_p: 2.5 → 0.5
-        "c2": [0.5, 2.5, "linear_increasing"],  # c_g: 0.5 → 2.5
-        "description": "Hybrid Cosine",
-        "config": {
-            "population_size": 100,
-            "generations": 100,
-            "multi_run_visualization": True
-        }
-    },
+    "hybrid_cosine": _mk([0.4, 0.9, "hybrid_cosine", "linear_decreasing", "SEP", "convex_decreasing"],
+                         _CP, _CG, "Hybrid Cosine"),
 
     # Estrategias básicas del runner 03 con configuración estándar
-    "concave_decreasing": {
-        "inertia_config": [0.4, 0.9, "concave_decreasing"],
-        "c1": [0.5, 2.5, "linear_decreasing"],  # c_p: 2.5 → 0.5
-        "c2": [0.5, 2.5, "linear_increasing"],  # c_g: 0.5 → 2.5
-        "description": "Concave Decreasing Inertia Weight",
-        "config": {
-            "population_size": 100,
-            "generations": 100,
-            "multi_run_visualization": True
-        }
-    },
-    "convex_decreasing": {
-        "inertia_config": [0.4, 0.9, "convex_decreasing"],
-        "c1": [0.5, 2.5, "linear_decreasing"],  # c_p: 2.5 → 0.5
-        "c2": [0.5, 2.5, "linear_increasing"],  # c_g: 0.5 → 2.5
-        "description": "Convex Decreasing Inertia Weight",
-        "config": {
-            "population_size": 100,
-            "generations": 100,
-            "multi_run_visualization": True
-        }
-    },
-    "convex_exp_decreasing": {
-        "inertia_config": [0.4, 0.9, "convex_exp_decreasing"],
-        "c1": [0.5, 2.5, "linear_decreasing"],  # c_p: 2.5 → 0.5
-        "c2": [0.5, 2.5, "linear_increasing"],  # c_g: 0.5 → 2.5
-        "description": "Convex Exponential Decreasing Inertia Weight",
-        "config": {
-            "population_size": 100,
-            "generations": 100,
-            "multi_run_visualization": True
-        }
-    },
-    "concave_exp_decreasing": {
-        "inertia_config": [0.4, 0.9, "concave_exp_decreasing"],
-        "c1": [0.5, 2.5, "linear_decreasing"],  # c_p: 2.5 → 0.5
-        "c2": [0.5, 2.5, "linear_increasing"],  # c_g: 0.5 → 2.5
-        "description": "Concave Exponential Decreasing Inertia Weight",
-        "config": {
-            "population_size": 100,
-            "generations": 100,
-            "multi_run_visualization": True
-        }
-    },
-    "concave_exp_increasing": {
-        "inertia_config": [0.4, 0.9, "concave_exp_increasing"],
-        "c1": [0.5, 2.5, "linear_decreasing"],  # c_p: 2.5 → 0.5
-        "c2": [0.5, 2.5, "linear_increasing"],  # c_g: 0.5 → 2.5
-        "description": "Concave Exponential Increasing Inertia Weight",
-        "config": {
-            "population_size": 100,
-            "generations": 100,
-            "multi_run_visualization": True
-        }
-    },
-    "convex_exp_increasing": {
-        "inertia_config": [0.4, 0.9, "convex_exp_increasing"],
-        "c1": [0.5, 2.5, "linear_decreasing"],  # c_p: 2.5 → 0.5
-        "c2": [0.5, 2.5, "linear_increasing"],  # c_g: 0.5 → 2.5
-        "description": "Convex Exponential Increasing Inertia Weight",
-        "config": {
-            "population_size": 100,
-            "generations": 100,
-            "multi_run_visualization": True
-        }
-    },
-    "aleatory": {
-        "inertia_config": [0.4, 0.9, "aleatory"],
-        "c1": [0.5, 2.5, "linear_decreasing"],  # c_p: 2.5 → 0.5
-        "c2": [0.5, 2.5, "linear_increasing"],  # c_g: 0.5 → 2.5
-        "description": "Random Inertia Weight",
-        "config": {
-            "population_size": 100,
-            "generations": 100,
-            "multi_run_visualization": True
-        }
-    }
+    "concave_decreasing": _mk([0.4, 0.9, "concave_decreasing"], _CP, _CG,
+                              "Concave Decreasing Inertia Weight"),
+    "convex_decreasing": _mk([0.4, 0.9, "convex_decreasing"], _CP, _CG,
+                             "Convex Decreasing Inertia Weight"),
+    "convex_exp_decreasing": _mk([0.4, 0.9, "convex_exp_decreasing"], _CP, _CG,
+                                 "Convex Exponential Decreasing Inertia Weight"),
+    "concave_exp_decreasing": _mk([0.4, 0.9, "concave_exp_decreasing"], _CP, _CG,
+                                  "Concave Exponential Decreasing Inertia Weight"),
+    "concave_exp_increasing": _mk([0.4, 0.9, "concave_exp_increasing"], _CP, _CG,
+                                  "Concave Exponential Increasing Inertia Weight"),
+    "convex_exp_increasing": _mk([0.4, 0.9, "convex_exp_increasing"], _CP, _CG,
+                                 "Convex Exponential Increasing Inertia Weight"),
+    "aleatory": _mk([0.4, 0.9, "aleatory"], _CP, _CG,
+                    "Random Inertia Weight"),
 }
 
 # Número de ejecuciones por combinación
@@ -205,21 +111,176 @@ RUNS = 30
 BASE_OUTPUT_DIR = Path("cases_inertia_strategies")
 
 
+# Cola de mensajes de progreso del proceso actual (None: escribir directamente)
+_LOG_QUEUE = None
+
+_LOG_COLORS = {"info": Fore.BLUE, "success": Fore.GREEN, "error": Fore.RED}
+
+
+def _init_logging(log_queue) -> None:
+    """Dirige los mensajes de progreso del proceso actual a una cola."""
+    global _LOG_QUEUE
+    _LOG_QUEUE = log_queue
+
+
+def _print_log(level: str, message: str) -> None:
+    """Escribe un mensaje de progreso en consola con su color."""
+    print(f"  {_LOG_COLORS[level]}{message}")
+
+
+def _log(level: str, message: str) -> None:
+    """Envía un mensaje de progreso al hilo encargado de la consola."""
+    if _LOG_QUEUE is None:
+        _print_log(level, message)
+    else:
+        _LOG_QUEUE.put((level, message))
+
+
+def _drain_queue(log_queue) -> None:
+    """Escribe en orden los mensajes de la cola hasta recibir None."""
+    for level, message in iter(log_queue.get, None):
+        _print_log(level, message)
+
+
+def _warmup(log_queue=None) -> None:
+    """Precarga las dependencias pesadas una sola vez por proceso trabajador."""
+    # Las interrupciones las gestiona únicamente el proceso principal
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    _init_logging(log_queue)
+
+    import numpy  # noqa: F401
+    import matplotlib  # noqa: F401
+    from src.main.handlers.pso_runner import PSORunner  # noqa: F401
+
+
+def _run_one(config: Dict[str, Any], label: str = "") -> Optional[str]:
+    """Ejecuta el algoritmo PSO para una configuración dentro del trabajador.
+
+    Debe ser una función de módulo para poder enviarse al pool de procesos.
+
+    Args:
+        config (Dict[str, Any]): Configuración completa de la ejecución.
+        label (str, optional): Descripción de la prueba para los mensajes de 
+            progreso. Defaults to "".
+
+    Returns:
+        Optional[str]: None si la ejecución terminó correctamente, o el mensaje
+            de error en caso contrario.
+    """
+    from src.main.handlers.pso_runner import PSORunner
+
+    _log("info", f"🚀 Ejecutando {label}")
+    try:
+        PSORunner(config).run()
+    except Exception as e:
+        return str(e)
+    return None
+
+
+def _run_one_subprocess(config: Dict[str, Any]) -> Optional[str]:
+    """Ejecuta una configuración lanzando main.py en un intérprete nuevo.
+
+    Mantiene el flujo anterior (archivo JSON temporal + subproceso) para
+    depuración mediante la opción --legacy-subprocess.
+
+    Args:
+        config (Dict[str, Any]): Configuración completa de la ejecución.
+
+    Returns:
+        Optional[str]: None si la ejecución terminó correctamente, o el mensaje
+            de error en caso contrario.
+    """
+    # Crear archivo temporal con la configuración (solo lo lee main.py, 
+    # así que se escribe sin sangría)
+    with tempfile.NamedTemporaryFile(suffix=".json", delete=False, mode="w") as tmp:
+        temp_filename = tmp.name
+        tmp.write(json.dumps(config, separators=(",", ":")))
+
+    try:
+        result = subprocess.run([sys.executable, "main.py", temp_filename], check=False)
+        if result.returncode != 0:
+            return f"código de salida {result.returncode}"
+        return None
+    except Exception as e:
+        return str(e)
+    finally:
+        # Limpiar archivo temporal
+        try:
+            os.unlink(temp_filename)
+        except OSError:
+            pass
+
+
 class UnifiedInertiaStrategiesRunner:
-    def __init__(self):
+    def __init__(self, legacy_subprocess: bool = False, 
+                 max_workers: Optional[int] = None):
         self.base_output_dir = BASE_OUTPUT_DIR
         self.benchmarks = BENCHMARKS
         self.dimensions = DIMENSIONS
         self.strategies = STRATEGIES
         self.runs = RUNS
         
+        # Pool de procesos reutilizado por todas las ejecuciones (se crea al 
+        # conocer el número de tareas)
+        self.legacy_subprocess = legacy_subprocess
+        self.max_workers = 1 if legacy_subprocess else (max_workers or os.cpu_count() or 1)
+        self._pool = None
+        self._pool_size = 0
+
+        # Pruebas enviadas al pool, para cancelar las pendientes al salir
+        self._futures = {}
+
+        # Mensajes de progreso de todos los procesos, escritos por un único hilo
+        self._log_queue = multiprocessing.Queue()
+        
         # Registrar manejador para interrupciones
         signal.signal(signal.SIGINT, self._handle_interrupt)
 
     def _handle_interrupt(self, signal_received, frame):
         print(f"\n{Fore.YELLOW}Ejecución interrumpida por el usuario. Saliendo...{Style.RESET_ALL}")
+        if self._pool is not None:
+            self._shutdown_pool(wait=False)
         sys.exit(0)
 
+    def _shutdown_pool(self, wait: bool = True) -> None:
+        """
+        Cancela las pruebas que aún no han empezado y cierra el pool.
+        
+        Sin cancelarlas, el cierre del pool (y el del propio intérprete) 
+        esperaría a que se ejecutasen todas las pruebas en cola.
+        
+        Args:
+            wait (bool): Si se espera a que terminen las pruebas en curso
+        """
+        for future in self._futures:
+            future.cancel()
+        self._pool.shutdown(wait=wait)
+
+    def _start_pool(self, num_tasks: int) -> int:
+        """
+        Crea el pool de procesos persistente si compensa usarlo.
+        
+        Con una sola tarea o un único trabajador las pruebas se ejecutan en el 
+        propio proceso, evitando el coste de arrancar el pool.
+        
+        Args:
+            num_tasks (int): Número de tareas a ejecutar
+
+        Returns:
+            int: Número de procesos que ejecutarán las tareas
+        """
+        pool_size = min(num_tasks, self.max_workers)
+        if pool_size <= 1:
+            return 1
+
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=pool_size, initializer=_warmup, initargs=(self._log_queue,)
+            )
+            self._pool_size = pool_size
+            atexit.register(self._shutdown_pool)
+        return self._pool_size
+
     def _create_config_for_strategy(self, strategy_config: Dict[str, Any], 
                                    benchmark: str, dimension: int) -> Dict[str, Any]:
         """
@@ -233,22 +294,19 @@ class UnifiedInertiaStrategiesRunner:
         Returns:
             Dict[str, Any]: Configuración completa para la estrategia
         """
-        # Comenzar con la configuración específica de la estrategia
-        config = strategy_config["config"].copy()
-        
-        # Agregar configuraciones dinámicas
-        config["dimensions"] = dimension
-        config["benchmark"] = benchmark
-        config["runs"] = self.runs
-        
-        # Configurar estrategia de inercia
-        config["inertia_type"] = strategy_config["inertia_config"]
-        
-        # Configurar coeficientes c1 y c2
-        config["c1"] = strategy_config["c1"]
-        config["c2"] = strategy_config["c2"]
-        
-        return config
+        # La plantilla de la estrategia es de solo lectura: se combina con 
+        # los valores de la tarea en un único diccionario nuevo
+        return {
+            **strategy_config["config"],
+            # Configuraciones dinámicas
+            "dimensions": dimension,
+            "benchmark": benchmark,
+            "runs": self.runs,
+            # Estrategia de inercia y coeficientes c1 y c2
+            "inertia_type": strategy_config["inertia_config"],
+            "c1": strategy_config["c1"],
+            "c2": strategy_config["c2"],
+        }
 
     def run_all(self):
         """
@@ -261,35 +319,43 @@ class UnifiedInertiaStrategiesRunner:
         print(f"{Fore.CYAN}{'='*80}")
 
         try:
-            for strategy_name, strategy_config in self.strategies.items():
-                print(f"\n{Fore.MAGENTA}{'='*60}")
-                print(f"{Fore.MAGENTA}= {Fore.WHITE}Estrategia: {strategy_config['description']}{Fore.MAGENTA}")
-                print(f"{Fore.MAGENTA}{'='*60}")
-                
-                # Crear directorio para esta estrategia
-                strategy_dir = self.base_output_dir / f"strategy_{strategy_name}"
-                strategy_dir.mkdir(parents=True, exist_ok=True)
-                
-                for dimension in self.dimensions:
-                    print(f"\n{Fore.YELLOW}  📊 Dimensión: {dimension}")
-                    
-                    # Crear directorio para esta dimensión
-                    dim_dir = strategy_dir / f"dimension{dimension}"
-                    dim_dir.mkdir(exist_ok=True)
-                    
-                    # Crear directorio para visualizaciones
-                    vis_dir = dim_dir / "visualizations"
-                    vis_dir.mkdir(exist_ok=True)
-                    
-                    for benchmark in self.benchmarks:
-                        self._run_benchmark(
-                            benchmark=benchmark,
-                            dimension=dimension,
-                            strategy_name=strategy_name,
-                            strategy_config=strategy_config,
-                            dim_dir=dim_dir,
-                            vis_dir=vis_dir
-                        )
+            tasks = [
+                (strategy_name, dimension, benchmark)
+                for strategy_name in self.strategies
+                for dimension in self.dimensions
+                for benchmark in self.benchmarks
+            ]
+            # Mezclar tareas baratas y costosas para equilibrar la carga de los 
+            # procesos (orden reproducible)
+            random.Random(0).shuffle(tasks)
+
+            workers = self._start_pool(len(tasks))
+            print(f"\n{Fore.BLUE}🚀 Ejecutando {len(tasks)} configuraciones en {workers} procesos")
+
+            log_thread = threading.Thread(
+                target=_drain_queue, args=(self._log_queue,), daemon=True
+            )
+            log_thread.start()
+            _init_logging(self._log_queue)
+
+            futures = self._futures
+            for strategy_name, dimension, benchmark in tasks:
+                config = self._build_benchmark_config(strategy_name, dimension, benchmark)
+                label = f"{strategy_name} · {benchmark} · dim {dimension}"
+                future = self._run_benchmark(config, label)
+                if future.done():
+                    # Ejecutada en el propio proceso: informar al terminar
+                    self._report_result(label, config, future.result())
+                else:
+                    futures[future] = (label, config)
+
+            for future in as_completed(futures):
+                label, config = futures[future]
+                self._report_result(label, config, future.result())
+
+            # Vaciar los mensajes pendientes antes del resumen final
+            self._log_queue.put(None)
+            log_thread.join()
                         
             print(f"\n{Fore.GREEN}{'='*80}")
             print(f"{Fore.GREEN}= {Fore.WHITE}¡Todas las ejecuciones completadas con éxito!{Fore.GREEN}")
@@ -300,19 +366,26 @@ class UnifiedInertiaStrategiesRunner:
             print(f"\n{Fore.RED}Error durante la ejecución: {str(e)}")
             sys.exit(1)
 
-    def _run_benchmark(self, benchmark, dimension, strategy_name, strategy_config, 
-                      dim_dir, vis_dir):
+    def _build_benchmark_config(self, strategy_name: str, dimension: int, 
+                                benchmark: str) -> Dict[str, Any]:
         """
-        Ejecuta una prueba con una configuración específica.
+        Construye la configuración de una prueba específica y crea sus directorios.
         
         Args:
-            benchmark (str): Nombre de la función benchmark
-            dimension (int): Dimensión del problema
             strategy_name (str): Nombre de la estrategia
-            strategy_config (Dict[str, Any]): Configuración de la estrategia
-            dim_dir (Path): Directorio para resultados
-            vis_dir (Path): Directorio para visualizaciones
+            dimension (int): Dimensión del problema
+            benchmark (str): Nombre de la función benchmark
+
+        Returns:
+            Dict[str, Any]: Configuración lista para ejecutarse en un trabajador
         """
+        strategy_config = self.strategies[strategy_name]
+
+        # Crear directorios de resultados y visualizaciones
+        dim_dir = self.base_output_dir / f"strategy_{strategy_name}" / f"dimension{dimension}"
+        vis_dir = dim_dir / "visualizations"
+        vis_dir.mkdir(parents=True, exist_ok=True)
+
         # Crear configuración específica para esta prueba usando la configuración de la estrategia
         config = self._create_config_for_strategy(strategy_config, benchmark, dimension)
         
@@ -322,6 +395,9 @@ class UnifiedInertiaStrategiesRunner:
         config["base_output_path"] = str(dim_dir)
         config["visualization_path"] = str(vis_dir / output_file)
         
+        # Las barras de progreso de varios procesos se mezclarían en la consola
+        config["show_progress_bar"] = False
+
         # Configurar visualizaciones
         config["show_multiple_visualizations"] = False
         config["save_multiple_visualizations"] = True
@@ -333,36 +409,48 @@ class UnifiedInertiaStrategiesRunner:
             "diversity": True
         }
 
-        print(f"\n  {Fore.BLUE}        • 🚀 Ejecutando {Fore.WHITE}{benchmark}{Fore.BLUE} "
-              f"con {strategy_name}: c1={strategy_config['c1']}, c2={strategy_config['c2']}")
+        return config
 
-        # Crear archivo temporal con la configuración
-        with tempfile.NamedTemporaryFile(suffix=".json", delete=False, mode="w") as tmp:
-            temp_filename = tmp.name
-            json.dump(config, tmp, indent=2)              
+    def _run_benchmark(self, config: Dict[str, Any], label: str) -> Future:
+        """
+        Envía una prueba al pool de procesos persistente.
         
-        try:
-            # Ejecutar el algoritmo PSO
-            result = subprocess.run(
-                f"python main.py {temp_filename}",
-                shell=True,
-                check=False
-            )
-            
-            if result.returncode == 0:
-                print(f"  {Fore.GREEN}           ✓ Completado{Fore.RESET} → Resultados: {dim_dir / (output_file + '.json')}")
-            else:
-                print(f"  {Fore.RED}            ✗ Error (código: {result.returncode})")
-                
-        except Exception as e:
-            print(f"  {Fore.RED}✗ Excepción: {str(e)}")
-        finally:
-            # Limpiar archivo temporal
-            try:
-                os.unlink(temp_filename)
-            except OSError:
-                pass
-            print(f"  {Fore.CYAN}{'─'*50}")
+        Sin pool (una sola tarea o un único trabajador) o con 
+        --legacy-subprocess la prueba se ejecuta en el momento y se devuelve 
+        un Future ya resuelto.
+        
+        Args:
+            config (Dict[str, Any]): Configuración de la prueba
+            label (str): Descripción de la prueba para los mensajes de progreso
+
+        Returns:
+            Future: Resultado pendiente de la ejecución
+        """
+        if self._pool is not None:
+            return self._pool.submit(_run_one, config, label)
+
+        future = Future()
+        if self.legacy_subprocess:
+            future.set_result(_run_one_subprocess(config))
+        else:
+            future.set_result(_run_one(config, label))
+        return future
+
+    def _report_result(self, label: str, config: Dict[str, Any], 
+                       error: Optional[str]) -> None:
+        """
+        Muestra el resultado de una prueba finalizada.
+        
+        Args:
+            label (str): Descripción de la prueba
+            config (Dict[str, Any]): Configuración ejecutada
+            error (Optional[str]): Mensaje de error, o None si terminó correctamente
+        """
+        if error is None:
+            result_path = Path(config["base_output_path"]) / (config["output_file"] + ".json")
+            _log("success", f"✓ {label}{Fore.RESET} → Resultados: {result_path}")
+        else:
+            _log("error", f"✗ {label}: {error}")
 
     def print_strategy_summary(self):
         """
@@ -386,7 +474,24 @@ class UnifiedInertiaStrategiesRunner:
 
 
 def main():
-    runner = UnifiedInertiaStrategiesRunner()
+    parser = argparse.ArgumentParser(description="Runner PSO unificado para todas las estrategias de inercia")
+    parser.add_argument(
+        "--legacy-subprocess",
+        action="store_true",
+        help="Ejecuta cada configuración con 'main.py' en un subproceso (depuración)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Número máximo de procesos (por defecto, todos los núcleos)",
+    )
+    args = parser.parse_args()
+
+    runner = UnifiedInertiaStrategiesRunner(
+        legacy_subprocess=args.legacy_subprocess,
+        max_workers=args.workers,
+    )
     
     # Mostrar resumen antes de empezar
     runner.print_strategy_summary()
@@ -2,5 +2,6 @@
 
 from src.main.algorithm.particle import PSOParticle
 from src.main.algorithm.pso import PSO
+from src.main.algorithm.swarm import SwarmState
 
-__all__ = ["PSO", "PSOParticle"]
\ No newline at end of file
+__all__ = ["PSO", "PSOParticle", "SwarmState"]
\ No newline at end of file
@@ -1,9 +1,24 @@
 """Módulo para cargar estrategias de coeficientes para algoritmos de optimización."""
 
-from typing import Tuple, Union
+from __future__ import annotations
+
+import sys
+from typing import Callable, Dict, Tuple, Union
 
 from src.main.algorithm.coefficient.coefficient_strategy import CoefficientStrategy
-from src.main.algorithm.coefficient.strategies import *
+from src.main.algorithm.coefficient.strategies import (
+    ConstantCoefficient,
+    LinearDecreasingCoefficient,
+    LinearIncreasingCoefficient,
+    RandomCoefficient,
+)
+
+# Constructores por tipo de estrategia; reciben (min, max) en ese orden
+_STRATEGY_MAP: Dict[str, Callable[[float, float], CoefficientStrategy]] = {
+    "decreasing": lambda min_val, max_val: LinearDecreasingCoefficient(max_val, min_val),
+    "increasing": LinearIncreasingCoefficient,
+    "random": RandomCoefficient,
+}
 
 
 def get_coefficient_strategy(
@@ -31,11 +46,11 @@ def get_coefficient_strategy(
         # Si se especifica un tipo, usarlo; de lo contrario, usar aleatorio
         strategy_type = config[2] if len(config) > 2 else "random"
 
-        if strategy_type.lower() == "decreasing":
-            return LinearDecreasingCoefficient(max_val, min_val)
-        elif strategy_type.lower() == "increasing":
-            return LinearIncreasingCoefficient(min_val, max_val)
-        else:  # Default to random
-            return RandomCoefficient(min_val, max_val)
+        # Normalizar el tipo una sola vez; al internarlo, la búsqueda en la 
+        # tabla compara por identidad con las claves literales.
+        # Tipos no reconocidos usan la estrategia aleatoria
+        strategy_type = sys.intern(strategy_type.lower())
+        create = _STRATEGY_MAP.get(strategy_type, RandomCoefficient)
+        return create(min_val, max_val)
 
     raise ValueError(f"Configuración de coeficiente no soportada: {config}")
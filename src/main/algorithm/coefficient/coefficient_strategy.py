@@ -2,9 +2,20 @@
 
 from abc import ABC, abstractmethod
 
+import numpy as np
+
 
 class CoefficientStrategy(ABC):
-    """Clase base abstracta para estrategias de coeficientes."""
+    """Clase base abstracta para estrategias de coeficientes.
+
+    Attributes:
+        is_constant (bool): Indica si el coeficiente no varía con las
+            iteraciones, permitiendo al algoritmo leer su valor una sola vez.
+    """
+
+    __slots__ = ()
+
+    is_constant = False
 
     @abstractmethod
     def __call__(self, current_iteration: int, max_iterations: int) -> float:
@@ -19,6 +30,26 @@ class CoefficientStrategy(ABC):
         """
         pass
 
+    def precompute(self, max_iterations: int) -> np.ndarray:
+        """Calcula los valores del coeficiente para todas las iteraciones.
+
+        La implementación por defecto evalúa la estrategia iteración a 
+        iteración; las subclases pueden sobrescribirla con una versión 
+        vectorizada.
+
+        Args:
+            max_iterations (int): Número máximo de iteraciones.
+
+        Returns:
+            np.ndarray: Array de longitud max_iterations con el valor del 
+                coeficiente para cada iteración.
+        """
+        return np.fromiter(
+            (self(i, max_iterations) for i in range(max_iterations)),
+            dtype=np.float64,
+            count=max_iterations,
+        )
+
     @abstractmethod
     def __str__(self) -> str:
         """Representación en cadena de la estrategia.
@@ -1,11 +1,16 @@
 """Implementación de la estrategia de coeficiente constante."""
 
+import numpy as np
+
 from src.main.algorithm.coefficient.coefficient_strategy import CoefficientStrategy
 
 
 class ConstantCoefficient(CoefficientStrategy):
     """Estrategia que mantiene un coeficiente constante."""
 
+    __slots__ = ("value",)
+    is_constant = True
+
     def __init__(self, value: float) -> None:
         """Inicializa el coeficiente constante.
 
@@ -26,6 +31,17 @@ class ConstantCoefficient(CoefficientStrategy):
         """
         return self.value
 
+    def precompute(self, max_iterations: int) -> np.ndarray:
+        """Devuelve el valor constante para todas las iteraciones.
+
+        Args:
+            max_iterations (int): Número máximo de iteraciones.
+
+        Returns:
+            np.ndarray: Array de longitud max_iterations con el valor constante.
+        """
+        return np.full(max_iterations, self.value, dtype=np.float64)
+
     def __str__(self) -> str:
         """Representación en cadena del coeficiente constante.
 
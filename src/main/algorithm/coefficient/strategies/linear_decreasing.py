@@ -1,11 +1,15 @@
 """Implementación de la estrategia de coeficiente linealmente decreciente."""
 
+import numpy as np
+
 from src.main.algorithm.coefficient.coefficient_strategy import CoefficientStrategy
 
 
 class LinearDecreasingCoefficient(CoefficientStrategy):
     """Estrategia que disminuye linealmente el coeficiente."""
 
+    __slots__ = ("start_value", "end_value", "_max_iterations", "_base", "_scale")
+
     def __init__(self, start_value: float, end_value: float) -> None:
         """Inicializa la estrategia de coeficiente decreciente.
 
@@ -16,6 +20,24 @@ class LinearDecreasingCoefficient(CoefficientStrategy):
         self.start_value = start_value
         self.end_value = end_value
 
+        # Recta precalculada para el número de iteraciones actual
+        self._max_iterations = None
+        self._base = end_value
+        self._scale = 0.0
+
+    def set_max_iterations(self, max_iterations: int) -> None:
+        """Precalcula la pendiente de la recta para un número de iteraciones.
+
+        Args:
+            max_iterations (int): Número máximo de iteraciones.
+        """
+        self._max_iterations = max_iterations
+        if max_iterations <= 1:
+            self._base, self._scale = self.end_value, 0.0
+        else:
+            self._base = self.start_value
+            self._scale = (self.end_value - self.start_value) / (max_iterations - 1)
+
     def __call__(self, current_iteration: int, max_iterations: int) -> float:
         """Calcula el valor del coeficiente para la iteración actual.
 
@@ -26,14 +48,26 @@ class LinearDecreasingCoefficient(CoefficientStrategy):
         Returns:
             float: El valor calculado para la iteración actual.
         """
-        if max_iterations <= 1:
-            return self.end_value
+        if max_iterations != self._max_iterations:
+            self.set_max_iterations(max_iterations)
 
         # Calcular el valor decreciente linealmente
-        value = self.start_value + (self.end_value - self.start_value) * (
-            current_iteration / (max_iterations - 1)
-        )
-        return value
+        return self._base + self._scale * current_iteration
+
+    def precompute(self, max_iterations: int) -> np.ndarray:
+        """Calcula el valor decreciente para todas las iteraciones.
+
+        Args:
+            max_iterations (int): Número máximo de iteraciones.
+
+        Returns:
+            np.ndarray: Array de longitud max_iterations con los valores del 
+                coeficiente.
+        """
+        if max_iterations <= 1:
+            return np.full(max_iterations, self.end_value, dtype=np.float64)
+
+        return np.linspace(self.start_value, self.end_value, max_iterations)
 
     def __str__(self) -> str:
         """Representación en cadena del coeficiente decreciente.
@@ -1,5 +1,7 @@
 """Implementación de la estrategia de coeficiente aleatorio."""
 
+from typing import Optional
+
 import numpy as np
 
 from src.main.algorithm.coefficient.coefficient_strategy import CoefficientStrategy
@@ -11,15 +13,32 @@ class RandomCoefficient(CoefficientStrategy):
     Genera un valor aleatorio dentro de un rango especificado.
     """
 
-    def __init__(self, min_value: float, max_value: float) -> None:
+    __slots__ = ("min_value", "max_value", "seed", "_rng")
+
+    def __init__(self, min_value: float, max_value: float, 
+                 seed: Optional[int] = None) -> None:
         """Inicializa la estrategia de coeficiente aleatorio.
 
         Args:
             min_value (float): Valor mínimo del coeficiente.
             max_value (float): Valor máximo del coeficiente.
+            seed (Optional[int], optional): Semilla del generador propio de la 
+                estrategia. Si es None, precompute siembra el generador desde 
+                el estado global de NumPy en cada ejecución. Defaults to None.
         """
         self.min_value = min_value
         self.max_value = max_value
+        self.seed = seed
+        self._rng = np.random.default_rng(seed)
+
+    def __reduce__(self):
+        """Reconstruye la estrategia desde sus parámetros al serializarla.
+
+        Cada proceso que recibe la estrategia crea así su propio generador 
+        en lugar de copiar el estado del original, evitando que varios 
+        trabajadores repitan la misma secuencia aleatoria.
+        """
+        return (type(self), (self.min_value, self.max_value, self.seed))
 
     def __call__(self, current_iteration: int, max_iterations: int) -> float:
         """Genera un único valor aleatorio para el coeficiente.
@@ -31,7 +50,25 @@ class RandomCoefficient(CoefficientStrategy):
         Returns:
             float: Un único valor aleatorio para usar como coeficiente.
         """
-        return np.random.uniform(self.min_value, self.max_value)
+        return self._rng.uniform(self.min_value, self.max_value)
+
+    def precompute(self, max_iterations: int) -> np.ndarray:
+        """Genera todos los valores aleatorios de la ejecución en una sola llamada.
+
+        Sin semilla explícita, el generador se siembra desde el estado global 
+        de NumPy, de modo que las ejecuciones con np.random.seed fijo siguen 
+        siendo reproducibles.
+
+        Args:
+            max_iterations (int): Número máximo de iteraciones.
+
+        Returns:
+            np.ndarray: Array de longitud max_iterations con valores aleatorios 
+                en [min_value, max_value).
+        """
+        if self.seed is None:
+            self._rng = np.random.default_rng(np.random.randint(2**32, dtype=np.uint64))
+        return self._rng.uniform(self.min_value, self.max_value, size=max_iterations)
 
     def __str__(self) -> str:
         """Representación en cadena del coeficiente aleatorio.
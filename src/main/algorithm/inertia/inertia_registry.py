@@ -65,7 +65,7 @@ class InertiaRegistry:
 
         strategy_class = cls._strategies[name]
 
-        # Patrón uniforme: todas las estrategias manejan sus parámetros
-        return strategy_class(w_min=w_min, w_max=w_max, params=params)
+        # Patrón uniforme: cada estrategia valida sus propios parámetros
+        return strategy_class.from_params(w_min=w_min, w_max=w_max, params=params)
     
     
\ No newline at end of file
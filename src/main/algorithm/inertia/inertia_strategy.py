@@ -1,13 +1,76 @@
 """Clase base para todas las estrategias de peso inercial."""
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional, Union
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 
 
+@lru_cache(maxsize=8)
+def progress_ratios(max_iterations: int) -> np.ndarray:
+    """Devuelve el ratio de progreso i / Max_it de todas las iteraciones.
+
+    El vector se calcula una sola vez por número de iteraciones y se comparte
+    entre las estrategias, por lo que es de solo lectura.
+
+    Args:
+        max_iterations (int): Número máximo de iteraciones.
+
+    Returns:
+        np.ndarray: Vector de longitud max_iterations con i / Max_it.
+    """
+    ratios = np.arange(max_iterations) / max_iterations
+    ratios.flags.writeable = False
+    return ratios
+
+
+@lru_cache(maxsize=8)
+def normalized_iterations(max_iterations: int) -> np.ndarray:
+    """Devuelve g = i / (Max_it - 1) de todas las iteraciones.
+
+    Es la variable normalizada en [0, 1] que usan las estrategias cóncavas,
+    convexas y lineales. Requiere max_iterations > 1 y es de solo lectura.
+
+    Args:
+        max_iterations (int): Número máximo de iteraciones.
+
+    Returns:
+        np.ndarray: Vector de longitud max_iterations con i / (Max_it - 1).
+    """
+    ratios = np.arange(max_iterations) / (max_iterations - 1)
+    ratios.flags.writeable = False
+    return ratios
+
+
+@lru_cache(maxsize=8)
+def remaining_ratios(max_iterations: int) -> np.ndarray:
+    """Devuelve el ratio restante (Max_it - i) / Max_it de todas las iteraciones.
+
+    Al igual que progress_ratios, el vector se comparte y es de solo lectura.
+
+    Args:
+        max_iterations (int): Número máximo de iteraciones.
+
+    Returns:
+        np.ndarray: Vector de longitud max_iterations con (Max_it - i) / Max_it.
+    """
+    ratios = (max_iterations - np.arange(max_iterations)) / max_iterations
+    ratios.flags.writeable = False
+    return ratios
+
+
 class InertiaStrategy(ABC):
-    """Clase base abstracta para estrategias de peso inercial."""
+    """Clase base abstracta para estrategias de peso inercial.
+
+    Attributes:
+        is_constant (bool): Indica si el peso inercial no varía con las
+            iteraciones, permitiendo al algoritmo calcularlo una sola vez.
+    """
+
+    __slots__ = ()
+
+    is_constant = False
 
     @abstractmethod
     def __call__(self, current_iteration: int, max_iterations: int,
@@ -24,7 +87,41 @@ class InertiaStrategy(ABC):
         Returns:
             Union[float, np.ndarray]: Un valor único de peso inercial para toda
                 la población, o un array con valores específicos para cada
-                partícula.
+                partícula. El valor no se recorta a [w_min, w_max]: cada
+                estrategia devuelve el resultado exacto de su fórmula.
+        """
+        pass
+
+    @classmethod
+    def from_params(cls, w_min: float, w_max: float,
+                    params: Union[List, Tuple] = None) -> "InertiaStrategy":
+        """Crea la estrategia a partir de los parámetros de la configuración.
+
+        Es el punto de entrada del registro. Las estrategias con parámetros
+        propios pueden sobrescribirlo para validarlos aquí y dejar el
+        constructor sin comprobaciones; por defecto los parámetros se pasan
+        al constructor tal cual.
+
+        Args:
+            w_min (float): Valor mínimo de peso inercial.
+            w_max (float): Valor máximo de peso inercial.
+            params (Union[List, Tuple], optional): Parámetros específicos de
+                la estrategia. Defaults to None.
+
+        Returns:
+            InertiaStrategy: Instancia de la estrategia.
+        """
+        return cls(w_min=w_min, w_max=w_max, params=params)
+
+    def prepare(self, max_iterations: int) -> None:
+        """Prepara la estrategia antes de comenzar una ejecución.
+
+        El algoritmo lo invoca una sola vez antes del bucle principal. Las
+        estrategias pueden sobrescribirlo para precalcular los valores que
+        solo dependen de la iteración; por defecto no hace nada.
+
+        Args:
+            max_iterations (int): Número máximo de iteraciones de la ejecución.
         """
         pass
 
@@ -32,12 +129,19 @@ class InertiaStrategy(ABC):
         """Recopila la información necesaria para esta estrategia.
 
         Cada estrategia que requiera información específica debe sobrescribir
-        este método.
+        este método. Se invoca en cada iteración, por lo que conviene devolver
+        directamente las matrices del estado (por ejemplo 'best_positions')
+        en lugar de reconstruirlas a partir de las partículas.
 
         Args:
             pso_state (Dict[str, Any]): Diccionario con el estado actual del
                 algoritmo PSO, que incluye:
-                - 'particles': Lista de todas las partículas
+                - 'swarm': Estado del enjambre (SwarmState)
+                - 'particles': Lista de vistas por partícula (ParticleView) 
+                  con position, velocity, best_position, fitness y 
+                  best_fitness
+                - 'best_positions': Matriz (n_partículas, dimensiones) con la
+                  mejor posición de cada partícula, actualizada en el sitio
                 - 'best_solution': Mejor solución global encontrada
                 - 'iteration': Iteración actual
                 - 'generations': Número total de generaciones
@@ -71,3 +175,76 @@ class InertiaStrategy(ABC):
                 población.
         """
         return self.requires_particle_info
+
+
+class PrecomputedSchedule(InertiaStrategy):
+    """Base para estrategias cuyo peso solo depende de la iteración.
+
+    prepare() guarda en una tabla el peso de todas las iteraciones, calculado
+    por _build_table() con la fórmula vectorizada de cada estrategia, y
+    __call__ solo tiene que indexarla. Con una única iteración la tabla
+    contiene w_min.
+
+    Attributes:
+        _table (Optional[np.ndarray]): Peso inercial de cada iteración de la
+            última ejecución preparada, o None si aún no se ha preparado.
+    """
+
+    __slots__ = ("_table",)
+
+    def prepare(self, max_iterations: int) -> None:
+        """Precalcula el peso inercial de todas las iteraciones.
+
+        Args:
+            max_iterations (int): Número máximo de iteraciones
+        """
+        if max_iterations <= 1:
+            self._table = np.full(max_iterations, self.w_min)
+        else:
+            self._table = self._build_table(max_iterations)
+
+    @abstractmethod
+    def _build_table(self, max_iterations: int) -> np.ndarray:
+        """Calcula el peso inercial de todas las iteraciones.
+
+        Args:
+            max_iterations (int): Número máximo de iteraciones (> 1)
+
+        Returns:
+            np.ndarray: Peso inercial de cada iteración.
+        """
+        pass
+
+
+def build_w_sequence(strategy: InertiaStrategy,
+                     max_iterations: int) -> Optional[np.ndarray]:
+    """Construye el peso inercial de todas las iteraciones de una ejecución.
+
+    Prepara la estrategia y reutiliza la tabla que haya precalculado; si no
+    la tiene, la evalúa una vez por iteración. Así el algoritmo solo indexa
+    el vector en el bucle principal, sin invocar la estrategia.
+
+    Args:
+        strategy (InertiaStrategy): Estrategia de peso inercial de la ejecución.
+        max_iterations (int): Número máximo de iteraciones.
+
+    Returns:
+        Optional[np.ndarray]: Vector de longitud max_iterations con el peso de
+            cada iteración, o None si la estrategia depende del estado de las
+            partículas y debe evaluarse en cada iteración.
+    """
+    if strategy.requires_particle_info or strategy.returns_array:
+        return None
+
+    strategy.prepare(max_iterations)
+
+    if strategy.is_constant:
+        return np.full(max_iterations, strategy(0, max_iterations), dtype=float)
+
+    if isinstance(strategy, PrecomputedSchedule):
+        return strategy._table
+
+    return np.fromiter(
+        (strategy(i, max_iterations) for i in range(max_iterations)),
+        dtype=float, count=max_iterations
+    )
@@ -1,46 +1,38 @@
-"""Módulo con las implementaciones de estrategias de peso inercial."""
+"""Módulo con las implementaciones de estrategias de peso inercial.
 
-# Estrategias básicas
-from src.main.algorithm.inertia.strategies.basic.constant import Constant
-from src.main.algorithm.inertia.strategies.basic.linear_decreasing import (
-    LinearDecreasing
-)
-from src.main.algorithm.inertia.strategies.basic.random import Random
+Las estrategias se importan de forma diferida (PEP 562): cada módulo se carga
+la primera vez que se accede a su clase, lo que también la registra en el
+InertiaRegistry. ``from ... import *`` resuelve todos los nombres de __all__.
+"""
 
-# Estrategias cóncavas
-from src.main.algorithm.inertia.strategies.concave.decreasing import (
-    ConcaveDecreasing
-)
-from src.main.algorithm.inertia.strategies.concave.exp_decreasing import (
-    ConcaveExponentialDecreasing
-)
-from src.main.algorithm.inertia.strategies.concave.exp_increasing import (
-    ConcaveExponentialIncreasing
-)
+import importlib
 
-# Estrategias convexas
-from src.main.algorithm.inertia.strategies.convex.decreasing import (
-    ConvexDecreasing
-)
-from src.main.algorithm.inertia.strategies.convex.exp_decreasing import (
-    ConvexExponentialDecreasing
-)
-from src.main.algorithm.inertia.strategies.convex.exp_increasing import (
-    ConvexExponentialIncreasing
-)
+_PACKAGE = "src.main.algorithm.inertia.strategies"
 
-# Estrategias avanzadas
-from src.main.algorithm.inertia.strategies.advanced.pso_niew import PSONIEW
-from src.main.algorithm.inertia.strategies.advanced.pso_siw import PSOSIW
-from src.main.algorithm.inertia.strategies.advanced.de_pso import DEPSO
-from src.main.algorithm.inertia.strategies.advanced.gpso import GPSO
-from src.main.algorithm.inertia.strategies.advanced.pso_tvac import PSOTVAC
-from src.main.algorithm.inertia.strategies.advanced.hybrid_cosine import (
-    HybridCosine
-)
-
-# Estrategias adaptativas
-from src.main.algorithm.inertia.strategies.adaptive.dsi_pso import DSIPSO
+# Nombre de la clase -> módulo que la define
+_LAZY = {
+    # Estrategias básicas
+    "Constant": f"{_PACKAGE}.basic.constant",
+    "LinearDecreasing": f"{_PACKAGE}.basic.linear_decreasing",
+    "Random": f"{_PACKAGE}.basic.random",
+    # Estrategias cóncavas
+    "ConcaveDecreasing": f"{_PACKAGE}.concave.decreasing",
+    "ConcaveExponentialDecreasing": f"{_PACKAGE}.concave.exp_decreasing",
+    "ConcaveExponentialIncreasing": f"{_PACKAGE}.concave.exp_increasing",
+    # Estrategias convexas
+    "ConvexDecreasing": f"{_PACKAGE}.convex.decreasing",
+    "ConvexExponentialDecreasing": f"{_PACKAGE}.convex.exp_decreasing",
+    "ConvexExponentialIncreasing": f"{_PACKAGE}.convex.exp_increasing",
+    # Estrategias avanzadas
+    "DEPSO": f"{_PACKAGE}.advanced.de_pso",
+    "GPSO": f"{_PACKAGE}.advanced.gpso",
+    "HybridCosine": f"{_PACKAGE}.advanced.hybrid_cosine",
+    "PSONIEW": f"{_PACKAGE}.advanced.pso_niew",
+    "PSOSIW": f"{_PACKAGE}.advanced.pso_siw",
+    "PSOTVAC": f"{_PACKAGE}.advanced.pso_tvac",
+    # Estrategias adaptativas
+    "DSIPSO": f"{_PACKAGE}.adaptive.dsi_pso",
+}
 
 __all__ = [
     # Básicas
@@ -65,3 +57,27 @@ __all__ = [
     # Adaptativas
     "DSIPSO"
 ]
+
+
+def __getattr__(name):
+    """Importa la estrategia solicitada la primera vez que se accede a ella.
+
+    Args:
+        name (str): Nombre del atributo solicitado
+
+    Returns:
+        type: Clase de la estrategia
+
+    Raises:
+        AttributeError: Si el nombre no corresponde a ninguna estrategia
+    """
+    if name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    """Incluye las estrategias diferidas en el listado del módulo."""
+    return sorted(list(globals()) + __all__)
@@ -8,7 +8,7 @@ from typing import Any, Dict, List, Optional, Tuple, Union
 import numpy as np
 
 from src.main.algorithm.inertia.inertia_registry import InertiaRegistry
-from src.main.algorithm.inertia.inertia_strategy import InertiaStrategy
+from src.main.algorithm.inertia.inertia_strategy import InertiaStrategy, remaining_ratios
 
 
 @InertiaRegistry.register("dsi_pso")
@@ -30,6 +30,8 @@ class DSIPSO(InertiaStrategy):
     - wik es el peso inercial para la partícula i en la iteración k
     """
 
+    __slots__ = ("w_min", "w_max", "sensitivity", "_time_factors", "_diff_buffer")
+
     def __init__(
         self,
         w_min: float = 0.4,
@@ -47,26 +49,25 @@ class DSIPSO(InertiaStrategy):
         self.w_min = w_min
         self.w_max = w_max
         self.sensitivity = 0.5  # Valor por defecto
+        self._time_factors = None
+        self._diff_buffer = None  # Matriz auxiliar reutilizada para |Gb - Pb_i|
 
-        if params is not None and len(params) > 0:
-            try:
-                sensitivity_value = params[0]
-                if not isinstance(sensitivity_value, (float, int)):
-                    raise ValueError(
-                        "El parámetro 'sensitivity' para DSI-PSO debe ser un número."
-                    )
-
-                sensitivity_value = float(sensitivity_value)
-                if not (0.0 <= sensitivity_value <= 1.0):
-                    raise ValueError(
-                        f"DSI-PSO sensitivity must be between 0.0 and 1.0, got: {sensitivity_value}"
-                    )
-
-                self.sensitivity = sensitivity_value
-            except (IndexError, ValueError, TypeError) as e:
+        if params:
+            # float() ya rechaza los tipos no numéricos con TypeError/ValueError
+            sensitivity_value = float(params[0])
+            if not 0.0 <= sensitivity_value <= 1.0:
                 raise ValueError(
-                    f"Error al procesar parámetro sensitivity para DSI-PSO: {e}"
-                ) from e
+                    f"DSI-PSO sensitivity must be between 0.0 and 1.0, got: {sensitivity_value}"
+                )
+            self.sensitivity = sensitivity_value
+
+    def prepare(self, max_iterations: int) -> None:
+        """Precalcula el factor temporal (Maxit - k) / Maxit de cada iteración.
+
+        Args:
+            max_iterations (int): Número máximo de iteraciones
+        """
+        self._time_factors = remaining_ratios(max_iterations)
 
     @property
     def requires_particle_info(self) -> bool:
@@ -80,6 +81,10 @@ class DSIPSO(InertiaStrategy):
     def collect_required_info(self, pso_state: Dict[str, Any]) -> Dict[str, Any]:
         """Recopila la información necesaria para la estrategia DSI-PSO.
 
+        Si el estado incluye la matriz 'best_positions' mantenida por el
+        algoritmo, se entrega directamente sin copiarla; en caso contrario se
+        construye a partir de las partículas.
+
         Args:
             pso_state (Dict[str, Any]): Diccionario con el estado actual del algoritmo PSO
 
@@ -90,15 +95,22 @@ class DSIPSO(InertiaStrategy):
             ValueError: Si no se encuentran las partículas o la mejor solución global
         """
         particles = pso_state.get('particles', [])
+        best_positions = pso_state.get('best_positions', None)
         best_solution = pso_state.get('best_solution', None)
 
-        if not particles or not best_solution:
+        if (best_positions is None and not particles) or not best_solution:
             raise ValueError(
                 "La estrategia DSI-PSO requiere acceso a las partículas y a la mejor solución global"
             )
 
+        if best_positions is None:
+            best_positions = np.stack([p.best_position for p in particles])
+
+        # La matriz del algoritmo ya es contigua; se verifica en modo depuración
+        assert best_positions.flags.c_contiguous, "best_positions debe ser C-contigua"
+
         return {
-            'best_positions_per_particle': [p.best_position for p in particles],
+            'best_positions_per_particle': best_positions,
             'global_best_position': best_solution.position
         }
 
@@ -114,12 +126,15 @@ class DSIPSO(InertiaStrategy):
             current_iteration (int): Iteración actual del algoritmo
             max_iterations (int): Número máximo de iteraciones
             particle_info (dict, optional): Diccionario con información de las partículas:
-                - 'best_positions_per_particle': Lista de mejores posiciones históricas de cada partícula
+                - 'best_positions_per_particle': Matriz (n_partículas, dimensiones) con las
+                  mejores posiciones históricas de cada partícula
                 - 'global_best_position': Mejor posición global del enjambre
                 Defaults to None.
 
         Returns:
-            np.ndarray: Array con los valores de peso inercial para cada partícula
+            np.ndarray: Array con los valores de peso inercial para cada partícula,
+                con el mismo tipo de dato que las posiciones recibidas (un
+                enjambre en float32 produce pesos en float32)
 
         Raises:
             ValueError: Si no se proporciona la información requerida de las partículas
@@ -133,29 +148,44 @@ class DSIPSO(InertiaStrategy):
                 "La estrategia DSI-PSO requiere información de las partículas y posición global"
             )
 
-        best_positions_per_particle = particle_info['best_positions_per_particle']
-        global_best = particle_info['global_best_position']
+        # Garantizar memoria contigua (sin copia si ya lo es) conservando el tipo
+        best_positions_per_particle = np.ascontiguousarray(
+            particle_info['best_positions_per_particle']
+        )
+        global_best = np.ascontiguousarray(particle_info['global_best_position'])
 
         # Asegurar que no se divida por cero
         if max_iterations <= 1:
-            return np.full(len(best_positions_per_particle), self.w_min)
+            return np.full(len(best_positions_per_particle), self.w_min,
+                           dtype=np.result_type(best_positions_per_particle, global_best))
 
         # Factor temporal: (Maxit - k) / Maxit
-        time_factor = (max_iterations - current_iteration) / max_iterations
-
-        # Distancia para cada partícula
-        distances = []
-        for best_pos in best_positions_per_particle:
-            # D_i = |Gb - Pb_i| * time_factor
-            abs_diff = np.abs(best_pos - global_best)
-            distance = np.sum(abs_diff) * time_factor
-            distances.append(distance)
-
-        # array -> numpy
-        distances = np.array(distances)
-
-        # Calcular el peso inercial
-        # wik = w_max / (w_min + e^(-sensitivity * D))
-        weights = self.w_max / (self.w_min + np.exp(-self.sensitivity * distances))
+        if self._time_factors is not None and len(self._time_factors) == max_iterations:
+            time_factor = self._time_factors[current_iteration]
+        else:
+            time_factor = (max_iterations - current_iteration) / max_iterations
+
+        # Reservar la matriz auxiliar solo si cambia la forma o el tipo
+        dtype = np.result_type(best_positions_per_particle, global_best)
+        abs_diff = self._diff_buffer
+        if (abs_diff is None or abs_diff.shape != best_positions_per_particle.shape
+                or abs_diff.dtype != dtype):
+            abs_diff = np.empty(best_positions_per_particle.shape, dtype=dtype)
+            self._diff_buffer = abs_diff
+
+        # Distancia L1 de todas las partículas a la vez: |Gb - Pb_i|
+        # (el valor absoluto se aplica sobre la misma matriz de diferencias)
+        np.subtract(best_positions_per_particle, global_best, out=abs_diff)
+        np.abs(abs_diff, out=abs_diff)
+        weights = abs_diff.sum(axis=1)
+
+        # Calcular el peso inercial sobre el mismo vector, sin temporales
+        # wik = w_max / (w_min + e^(-sensitivity * D)), con D = |Gb - Pb_i| * time_factor
+        # La sensibilidad y el factor temporal se combinan en un único escalar
+        weights *= -self.sensitivity * time_factor
+        np.exp(weights, out=weights)
+        weights += self.w_min
+        np.reciprocal(weights, out=weights)
+        weights *= self.w_max
 
         return weights
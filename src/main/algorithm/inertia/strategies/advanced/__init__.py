@@ -1,12 +1,44 @@
 """
 Paquete para estrategias avanzadas de peso inercial.
+
+Las estrategias se importan de forma diferida la primera vez que se accede a
+ellas (PEP 562).
 """
 
-from src.main.algorithm.inertia.strategies.advanced.de_pso import DEPSO
-from src.main.algorithm.inertia.strategies.advanced.gpso import GPSO
-from src.main.algorithm.inertia.strategies.advanced.hybrid_cosine import HybridCosine
-from src.main.algorithm.inertia.strategies.advanced.pso_niew import PSONIEW
-from src.main.algorithm.inertia.strategies.advanced.pso_siw import PSOSIW
-from src.main.algorithm.inertia.strategies.advanced.pso_tvac import PSOTVAC
+import importlib
+
+_LAZY = {
+    "DEPSO": "de_pso",
+    "GPSO": "gpso",
+    "HybridCosine": "hybrid_cosine",
+    "PSONIEW": "pso_niew",
+    "PSOSIW": "pso_siw",
+    "PSOTVAC": "pso_tvac",
+}
 
 __all__ = ["DEPSO", "GPSO", "HybridCosine", "PSONIEW", "PSOSIW", "PSOTVAC"]
+
+
+def __getattr__(name):
+    """Importa la estrategia solicitada la primera vez que se accede a ella.
+
+    Args:
+        name (str): Nombre del atributo solicitado
+
+    Returns:
+        type: Clase de la estrategia
+
+    Raises:
+        AttributeError: Si el nombre no corresponde a ninguna estrategia
+    """
+    if name in _LAZY:
+        module = importlib.import_module(f"{__name__}.{_LAZY[name]}")
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    """Incluye las estrategias diferidas en el listado del módulo."""
+    return sorted(list(globals()) + __all__)
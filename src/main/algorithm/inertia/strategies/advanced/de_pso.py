@@ -3,15 +3,30 @@
 (Double exponential adaptive inertia weight PSO).
 """
 
-import math
 from typing import List, Tuple, Union
 
-from src.main.algorithm.inertia.inertia_strategy import InertiaStrategy
+import numpy as np
+
+from src.main.algorithm.inertia.inertia_strategy import PrecomputedSchedule, remaining_ratios
 from src.main.algorithm.inertia.inertia_registry import InertiaRegistry
 
 
+def de_pso_weight(remaining_ratio):
+    """Fórmula DE-PSO: w = exp(-e^(-R)), con R = (Max_it - i) / Max_it.
+
+    Acepta tanto un ratio escalar como un vector de ratios.
+
+    Args:
+        remaining_ratio (Union[float, np.ndarray]): Ratio restante R
+
+    Returns:
+        Union[float, np.ndarray]: Peso(s) inercial(es) correspondiente(s)
+    """
+    return np.exp(-np.exp(-remaining_ratio))
+
+
 @InertiaRegistry.register("de_pso")
-class DEPSO(InertiaStrategy):
+class DEPSO(PrecomputedSchedule):
     """Implementación de la estrategia de peso inercial DE-PSO.
 
     Fórmulas:
@@ -22,6 +37,8 @@ class DEPSO(InertiaStrategy):
     utilizando una función exponencial doble para el control del peso inercial.
     """
 
+    __slots__ = ("w_min", "w_max")
+
     def __init__(self, w_min: float = 0.4, w_max: float = 0.8,
                  params: Union[List, Tuple] = None):
         """Inicializa la estrategia de peso inercial DE-PSO.
@@ -34,6 +51,18 @@ class DEPSO(InertiaStrategy):
         """
         self.w_min = w_min
         self.w_max = w_max
+        self._table = None
+
+    def _build_table(self, max_iterations: int) -> np.ndarray:
+        """Calcula el peso inercial de todas las iteraciones.
+
+        Args:
+            max_iterations (int): Número máximo de iteraciones (> 1)
+
+        Returns:
+            np.ndarray: Peso inercial de cada iteración.
+        """
+        return de_pso_weight(remaining_ratios(max_iterations))
 
     def __call__(self, current_iteration: int, max_iterations: int,
                  particle_info: dict = None) -> float:
@@ -48,16 +77,14 @@ class DEPSO(InertiaStrategy):
         Returns:
             float: Valor del peso inercial para la iteración actual
         """
+        # Usar la tabla precalculada si corresponde a esta ejecución
+        if self._table is not None and len(self._table) == max_iterations:
+            return self._table[current_iteration]
+
         # Asegurar que no se divida por cero
         if max_iterations <= 1:
             return self.w_min
 
         # Calcular R = (Max_it - i) / Max_it
         R = (max_iterations - current_iteration) / max_iterations
-
-        # Fórmula DE-PSO: w = exp(-e^(-R))
-        inner_exp = math.exp(-R)
-        weight = math.exp(-inner_exp)
-
-        # Asegurar que el peso esté dentro de los límites razonables
-        return weight
+        return de_pso_weight(R)
@@ -5,12 +5,30 @@
 
 from typing import List, Tuple, Union
 
-from src.main.algorithm.inertia.inertia_strategy import InertiaStrategy
+import numpy as np
+
+from src.main.algorithm.inertia.inertia_strategy import PrecomputedSchedule, progress_ratios
 from src.main.algorithm.inertia.inertia_registry import InertiaRegistry
 
 
+def gpso_weight(progress_ratio, w_min: float, w_max: float):
+    """Fórmula GPSO: w = (w_max - w_min) * (i / Max_it).
+
+    Acepta tanto un ratio escalar como un vector de ratios.
+
+    Args:
+        progress_ratio (Union[float, np.ndarray]): Ratio de progreso i / Max_it
+        w_min (float): Valor mínimo del peso inercial
+        w_max (float): Valor máximo del peso inercial
+
+    Returns:
+        Union[float, np.ndarray]: Peso(s) inercial(es) correspondiente(s)
+    """
+    return (w_max - w_min) * progress_ratio
+
+
 @InertiaRegistry.register("gpso")
-class GPSO(InertiaStrategy):
+class GPSO(PrecomputedSchedule):
     """
     Implementación de la estrategia de peso inercial GPSO (Global PSO).
 
@@ -23,6 +41,8 @@ class GPSO(InertiaStrategy):
     w = (w_max - w_min) * (i / Max_it) + w_min
     """
 
+    __slots__ = ("w_min", "w_max")
+
     def __init__(self, w_min: float = 0.5, w_max: float = 0.9,
                  params: Union[List, Tuple] = None):
         """Inicializa la estrategia de peso inercial GPSO.
@@ -35,6 +55,19 @@ class GPSO(InertiaStrategy):
         """
         self.w_min = w_min
         self.w_max = w_max
+        self._table = None
+
+    def _build_table(self, max_iterations: int) -> np.ndarray:
+        """Calcula el peso inercial de todas las iteraciones.
+
+        Args:
+            max_iterations (int): Número máximo de iteraciones (> 1)
+
+        Returns:
+            np.ndarray: Peso inercial de cada iteración.
+        """
+        return gpso_weight(progress_ratios(max_iterations),
+                           self.w_min, self.w_max)
 
     def __call__(self, current_iteration: int, max_iterations: int,
                  particle_info: dict = None) -> float:
@@ -49,14 +82,12 @@ class GPSO(InertiaStrategy):
         Returns:
             float: Valor del peso inercial para la iteración actual
         """
+        # Usar la tabla precalculada si corresponde a esta ejecución
+        if self._table is not None and len(self._table) == max_iterations:
+            return self._table[current_iteration]
+
         # Asegurar que no se divida por cero
         if max_iterations <= 1:
             return self.w_min
 
-        # Calcular el ratio de progreso
-        progress_ratio = current_iteration / max_iterations
-
-        # Fórmula GPSO: w = (w_max - w_min) * (i / Max_it)
-        weight = (self.w_max - self.w_min) * progress_ratio
-
-        return weight
\ No newline at end of file
+        return gpso_weight(current_iteration / max_iterations, self.w_min, self.w_max)
\ No newline at end of file
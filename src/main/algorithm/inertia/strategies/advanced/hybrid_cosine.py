@@ -25,6 +25,10 @@ class HybridCosine(InertiaStrategy):
     creando transiciones suaves y comportamientos adaptativos únicos.
     """
 
+    __slots__ = ("w_min", "w_max", "strategy_g", "strategy_h", "_wg", "_wh",
+                 "_g_call", "_h_call", "_g_needs_info", "_h_needs_info",
+                 "_needs_info")
+
     def __init__(self, w_min: float = 0.4, w_max: float = 0.9,
                  params: Union[List, Tuple] = None):
         """
@@ -44,6 +48,8 @@ class HybridCosine(InertiaStrategy):
         self.w_max = w_max
         self.strategy_g = None  # Primera estrategia g(k)
         self.strategy_h = None  # Segunda estrategia h(k)
+        self._wg = None  # Pesos de interpolación precalculados para g(k)
+        self._wh = None  # Pesos de interpolación precalculados para h(k)
 
         if params is not None:
             self._parse_and_create_strategies(params)
@@ -51,6 +57,19 @@ class HybridCosine(InertiaStrategy):
             # Configuración por defecto: linear_decreasing + constant
             self._create_default_strategies()
 
+        self._bind_strategies()
+
+    def _bind_strategies(self) -> None:
+        """
+        Enlaza directamente las llamadas de ambas estrategias y precalcula qué
+        información requieren, evitando búsquedas de atributos en cada iteración.
+        """
+        self._g_call = self.strategy_g.__call__
+        self._h_call = self.strategy_h.__call__
+        self._g_needs_info = bool(self.strategy_g.requires_particle_info)
+        self._h_needs_info = bool(self.strategy_h.requires_particle_info)
+        self._needs_info = self._g_needs_info or self._h_needs_info
+
     def _parse_and_create_strategies(self, params: Union[List, Tuple]) -> None:
         """
         Parsea los parámetros y crea las dos estrategias híbridas.
@@ -132,6 +151,27 @@ class HybridCosine(InertiaStrategy):
         self.strategy_g = get_inertia_strategy([self.w_min, self.w_max, "linear_decreasing"])
         self.strategy_h = get_inertia_strategy(self.w_min)  # Valor constante
 
+    def prepare(self, max_iterations: int) -> None:
+        """Precalcula los pesos de interpolación coseno y prepara ambas estrategias.
+
+        Args:
+            max_iterations (int): Número máximo de iteraciones
+        """
+        if max_iterations <= 1:
+            # Promedio de ambas estrategias
+            self._wg = np.full(max_iterations, 0.5)
+            self._wh = np.full(max_iterations, 0.5)
+        else:
+            phi = (1 + math.sqrt(5)) / 2
+            cos_k_pi = np.cos((np.arange(max_iterations) * np.pi) / phi)
+            self._wg = (1 + cos_k_pi) / 2
+            self._wh = (1 - cos_k_pi) / 2
+
+        if self.strategy_g:
+            self.strategy_g.prepare(max_iterations)
+        if self.strategy_h:
+            self.strategy_h.prepare(max_iterations)
+
     @property
     def requires_particle_info(self) -> bool:
         """
@@ -140,8 +180,7 @@ class HybridCosine(InertiaStrategy):
         Returns:
             bool: True si cualquiera de las estrategias requiere información de partículas
         """
-        return (self.strategy_g and self.strategy_g.requires_particle_info) or \
-               (self.strategy_h and self.strategy_h.requires_particle_info)
+        return self._needs_info
 
     @property
     def returns_array(self) -> bool:
@@ -167,10 +206,10 @@ class HybridCosine(InertiaStrategy):
         """
         info = {}
 
-        if self.strategy_g and self.strategy_g.requires_particle_info:
+        if self._g_needs_info:
             info.update(self.strategy_g.collect_required_info(pso_state))
 
-        if self.strategy_h and self.strategy_h.requires_particle_info:
+        if self._h_needs_info:
             info.update(self.strategy_h.collect_required_info(pso_state))
 
         return info
@@ -195,44 +234,27 @@ class HybridCosine(InertiaStrategy):
         if not self.strategy_g or not self.strategy_h:
             raise ValueError("Hybrid cosine strategy not properly initialized")
 
-        # Asegurar que no se divida por cero
-        if max_iterations <= 1:
-            # En caso extremo, retornar promedio de ambas estrategias
-            g_value = self.strategy_g(current_iteration, max_iterations, particle_info)
-            h_value = self.strategy_h(current_iteration, max_iterations, particle_info)
-
-            if isinstance(g_value, np.ndarray) or isinstance(h_value, np.ndarray):
-                return (np.asarray(g_value) + np.asarray(h_value)) / 2
-            else:
-                return (g_value + h_value) / 2
-
-        # Calcular los pesos de interpolación coseno
-        phi = (1 + math.sqrt(5)) / 2
-        cos_k_pi = math.cos((current_iteration * math.pi) / phi)
-        weight_g = (1 + cos_k_pi) / 2  # Peso para g(k)
-        weight_h = (1 - cos_k_pi) / 2  # Peso para h(k)
+        # Usar los pesos precalculados si corresponden a esta ejecución
+        if self._wg is not None and len(self._wg) == max_iterations:
+            weight_g = self._wg[current_iteration]
+            weight_h = self._wh[current_iteration]
+        elif max_iterations <= 1:
+            # En caso extremo (sin división posible), promedio de ambas estrategias
+            weight_g = weight_h = 0.5
+        else:
+            # Calcular los pesos de interpolación coseno
+            phi = (1 + math.sqrt(5)) / 2
+            cos_k_pi = math.cos((current_iteration * math.pi) / phi)
+            weight_g = (1 + cos_k_pi) / 2  # Peso para g(k)
+            weight_h = (1 - cos_k_pi) / 2  # Peso para h(k)
 
         # Obtener valores de ambas estrategias
-        g_value = self.strategy_g(current_iteration, max_iterations, particle_info)
-        h_value = self.strategy_h(current_iteration, max_iterations, particle_info)
-
-        # Normalizar a arrays si es necesario para consistencia
-        if isinstance(g_value, np.ndarray) or isinstance(h_value, np.ndarray):
-            # Al menos una estrategia retorna array, convertir ambas a arrays
-            g_array = np.asarray(g_value) if not isinstance(g_value, np.ndarray) else g_value
-            h_array = np.asarray(h_value) if not isinstance(h_value, np.ndarray) else h_value
-
-            # Si una es escalar y otra array, expandir la escalar para coincidir
-            if g_array.ndim == 0 and h_array.ndim > 0:
-                g_array = np.full_like(h_array, g_array.item())
-            elif h_array.ndim == 0 and g_array.ndim > 0:
-                h_array = np.full_like(g_array, h_array.item())
-
-            # Aplicar la fórmula híbrida
-            return weight_g * g_array + weight_h * h_array
-        else:
-            # Ambas son escalares
-            return weight_g * g_value + weight_h * h_value
+        g_value = self._g_call(current_iteration, max_iterations, particle_info)
+        h_value = self._h_call(current_iteration, max_iterations, particle_info)
+
+        # Aplicar la fórmula híbrida; el broadcasting de NumPy combina
+        # escalares y arrays por partícula sin conversiones explícitas
+        return weight_g * g_value + weight_h * h_value
 
     def __str__(self) -> str:
         """
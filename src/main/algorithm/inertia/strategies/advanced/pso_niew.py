@@ -6,10 +6,28 @@ PSO-NIEW (Non-linear Exponential Inertia Weight).
 import math
 from typing import List, Optional, Tuple, Union
 
+import numpy as np
+
 from src.main.algorithm.inertia.inertia_strategy import InertiaStrategy
 from src.main.algorithm.inertia.inertia_registry import InertiaRegistry
 
 
+def pso_niew_weight(progress_ratio, w_min: float, w_max: float):
+    """Fórmula PSO-NIEW: w = w_min + (w_max - w_min) * exp(-10 * i / Max_it).
+
+    Acepta tanto un ratio escalar como un vector de ratios.
+
+    Args:
+        progress_ratio (Union[float, np.ndarray]): Ratio de progreso i / Max_it
+        w_min (float): Valor mínimo del peso inercial
+        w_max (float): Valor máximo del peso inercial
+
+    Returns:
+        Union[float, np.ndarray]: Peso(s) inercial(es) correspondiente(s)
+    """
+    return w_min + (w_max - w_min) * np.exp(-10.0 * progress_ratio)
+
+
 @InertiaRegistry.register("pso_niew")
 class PSONIEW(InertiaStrategy):
     """Implementación de la estrategia de peso inercial PSO-NIEW.
@@ -17,6 +35,8 @@ class PSONIEW(InertiaStrategy):
     Fórmula: w = w_min + (w_max - w_min) * exp(-10 * i / Max_it)
     """
 
+    __slots__ = ("w_min", "w_max", "_max_iterations", "_k", "_delta")
+
     def __init__(self, w_min: float = 0.4, w_max: float = 0.9,
                  params: Union[List, Tuple] = None):
         """Inicializa la estrategia de peso inercial PSO-NIEW.
@@ -29,6 +49,19 @@ class PSONIEW(InertiaStrategy):
         """
         self.w_max = w_max
         self.w_min = w_min
+        self._max_iterations = None
+        self._k = None
+        self._delta = None
+
+    def prepare(self, max_iterations: int) -> None:
+        """Precalcula los factores constantes de la fórmula para la ejecución.
+
+        Args:
+            max_iterations (int): Número máximo de iteraciones
+        """
+        self._max_iterations = max_iterations
+        self._k = -10.0 / max_iterations if max_iterations > 1 else 0.0
+        self._delta = self.w_max - self.w_min
 
     def __call__(self, current_iteration: int, max_iterations: int,
                  particle_info: Optional[dict] = None) -> float:
@@ -47,11 +80,8 @@ class PSONIEW(InertiaStrategy):
         if max_iterations <= 1:
             return self.w_min
 
-        # Calcular el ratio de progreso
-        progress_ratio = current_iteration / max_iterations
-
-        # Fórmula PSO-NIEW: w = w_min + (w_max - w_min) * exp(-10 * i / Max_it)
-        exponential_factor = math.exp(-10.0 * progress_ratio)
-        weight = self.w_min + (self.w_max - self.w_min) * exponential_factor
+        # Usar los factores precalculados si corresponden a esta ejecución
+        if max_iterations == self._max_iterations:
+            return self.w_min + self._delta * math.exp(self._k * current_iteration)
 
-        return weight
+        return pso_niew_weight(current_iteration / max_iterations, self.w_min, self.w_max)
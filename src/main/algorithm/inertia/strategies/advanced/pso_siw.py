@@ -5,12 +5,14 @@
 
 from typing import List, Tuple, Union
 
-from src.main.algorithm.inertia.inertia_strategy import InertiaStrategy
+import numpy as np
+
+from src.main.algorithm.inertia.inertia_strategy import PrecomputedSchedule, progress_ratios
 from src.main.algorithm.inertia.inertia_registry import InertiaRegistry
 
 
 @InertiaRegistry.register("pso_siw")
-class PSOSIW(InertiaStrategy):
+class PSOSIW(PrecomputedSchedule):
     """Implementación de la estrategia de peso inercial PSO-SIW.
 
     Fórmula: w = w_min - (w_max^(i/Max_it)) / (1 + s^(i/Max_it))
@@ -19,19 +21,40 @@ class PSOSIW(InertiaStrategy):
     proporcionando una transición suave entre exploración y explotación.
     """
 
-    def __init__(self, w_min: float = 0.4, w_max: float = 0.5,
-                 params: Union[List, Tuple] = None):
+    __slots__ = ("w_min", "w_max", "s")
+
+    def __init__(self, w_min: float = 0.4, w_max: float = 0.5, s: float = 2.0):
         """Inicializa la estrategia de peso inercial PSO-SIW.
 
         Args:
             w_min (float): Valor mínimo del peso inercial (w_min=0.4)
             w_max (float): Valor máximo del peso inercial (w_max=0.5)
-            params (Union[List, Tuple], optional): Parámetros específicos: [s]
-                   donde s es el parámetro de forma sigmoidal. Defaults to None.
+            s (float, optional): Parámetro de forma sigmoidal, ya validado. 
+                Defaults to 2.0.
         """
         self.w_min = w_min
         self.w_max = w_max
-        self.s = 2.0  # Valor por defecto
+        self.s = s
+        self._table = None
+
+    @classmethod
+    def from_params(cls, w_min: float, w_max: float,
+                    params: Union[List, Tuple] = None) -> "PSOSIW":
+        """Crea la estrategia validando el parámetro opcional [s].
+
+        Args:
+            w_min (float): Valor mínimo del peso inercial
+            w_max (float): Valor máximo del peso inercial
+            params (Union[List, Tuple], optional): Parámetros específicos: [s]
+                   donde s es el parámetro de forma sigmoidal. Defaults to None.
+
+        Returns:
+            PSOSIW: Instancia de la estrategia.
+
+        Raises:
+            ValueError: Si 's' no es un número positivo.
+        """
+        s_value = 2.0  # Valor por defecto
 
         if params is not None and len(params) > 0:
             try:
@@ -42,11 +65,25 @@ class PSOSIW(InertiaStrategy):
                 s_value = float(s_value)
                 if s_value <= 0:
                     raise ValueError(f"PSO-SIW parameter 's' must be positive, got: {s_value}")
-
-                self.s = s_value
             except (IndexError, ValueError, TypeError) as e:
                 raise ValueError(f"Error al procesar parámetro 's' para PSO-SIW: {e}") from e
 
+        return cls(w_min=w_min, w_max=w_max, s=s_value)
+
+    def _build_table(self, max_iterations: int) -> np.ndarray:
+        """Calcula el peso inercial de todas las iteraciones.
+
+        Args:
+            max_iterations (int): Número máximo de iteraciones (> 1)
+
+        Returns:
+            np.ndarray: Peso inercial de cada iteración.
+        """
+        progress_ratio = progress_ratios(max_iterations)
+        numerator = self.w_max * progress_ratio
+        denominator = 1 + (self.s * progress_ratio)
+        return self.w_min - (numerator / denominator)
+
     def __call__(self, current_iteration: int, max_iterations: int,
                  particle_info: dict = None) -> float:
         """Calcula el valor del peso inercial para la iteración actual.
@@ -60,6 +97,10 @@ class PSOSIW(InertiaStrategy):
         Returns:
             float: Valor del peso inercial para la iteración actual
         """
+        # Usar la tabla precalculada si corresponde a esta ejecución
+        if self._table is not None and len(self._table) == max_iterations:
+            return self._table[current_iteration]
+
         # Asegurar que no se divida por cero
         if max_iterations <= 1:
             return self.w_min
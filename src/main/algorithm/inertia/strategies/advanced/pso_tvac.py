@@ -5,12 +5,14 @@
 
 from typing import List, Optional, Tuple, Union
 
+import numpy as np
+
 from src.main.algorithm.inertia.inertia_registry import InertiaRegistry
-from src.main.algorithm.inertia.inertia_strategy import InertiaStrategy
+from src.main.algorithm.inertia.inertia_strategy import PrecomputedSchedule
 
 
 @InertiaRegistry.register("pso_tvac")
-class PSOTVAC(InertiaStrategy):
+class PSOTVAC(PrecomputedSchedule):
     """Implementación de la estrategia de peso inercial PSO-TVAC.
 
     Fórmulas:
@@ -22,6 +24,8 @@ class PSOTVAC(InertiaStrategy):
     Los coeficientes c1 y c2 deben ser manejados por el algoritmo PSO principal.
     """
 
+    __slots__ = ("w_min", "w_max", "_slope", "_cached_max_it")
+
     def __init__(self, w_min: float = 0.4, w_max: float = 0.9,
                  params: Union[List, Tuple] = None) -> None:
         """Inicializa la estrategia de peso inercial PSO-TVAC.
@@ -34,6 +38,22 @@ class PSOTVAC(InertiaStrategy):
         """
         self.w_min = w_min
         self.w_max = w_max
+        self._table = None
+        self._slope = None
+        self._cached_max_it = -1
+
+    def _build_table(self, max_iterations: int) -> np.ndarray:
+        """Calcula el peso inercial de todas las iteraciones.
+
+        Args:
+            max_iterations (int): Número máximo de iteraciones (> 1)
+
+        Returns:
+            np.ndarray: Peso inercial de cada iteración.
+        """
+        iterations = np.arange(max_iterations)
+        return (self.w_max -
+                ((self.w_max - self.w_min) / max_iterations) * iterations)
 
     def __call__(self, current_iteration: int, max_iterations: int,
                  particle_info: Optional[dict] = None) -> float:
@@ -48,13 +68,18 @@ class PSOTVAC(InertiaStrategy):
         Returns:
             float: Valor del peso inercial para la iteración actual.
         """
+        # Usar la tabla precalculada si corresponde a esta ejecución
+        if self._table is not None and len(self._table) == max_iterations:
+            return self._table[current_iteration]
+
         # Asegurar que no se divida por cero
         if max_iterations <= 1:
             return self.w_min
 
-        # Fórmula PSO-TVAC: w = w_max - ((w_max - w_min) / iter_max) * k
-        weight = (self.w_max - 
-                  ((self.w_max - self.w_min) / max_iterations) * current_iteration)
+        # Pendiente (w_max - w_min) / iter_max, constante durante la ejecución
+        if max_iterations != self._cached_max_it:
+            self._slope = (self.w_max - self.w_min) / max_iterations
+            self._cached_max_it = max_iterations
 
-        # Asegurar que el peso esté dentro de los límites
-        return weight
\ No newline at end of file
+        # Fórmula PSO-TVAC: w = w_max - ((w_max - w_min) / iter_max) * k
+        return self.w_max - self._slope * current_iteration
\ No newline at end of file
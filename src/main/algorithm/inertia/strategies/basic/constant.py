@@ -10,8 +10,12 @@ from src.main.algorithm.inertia.inertia_strategy import InertiaStrategy
 class Constant(InertiaStrategy):
     """Estrategia de peso inercial fijo para PSO."""
 
+    __slots__ = ("value",)
+
+    is_constant = True
+
     def __init__(self, w_min: float = 0.4, w_max: float = 0.9,
-                 params: Union[List, Tuple] = None) -> None:
+                 value: Optional[float] = None) -> None:
         """Inicializa la estrategia de peso inercial constante.
 
         Args:
@@ -19,14 +23,31 @@ class Constant(InertiaStrategy):
                 Defaults to 0.4.
             w_max (float): Valor máximo del peso inercial (usado como valor
                 constante por defecto). Defaults to 0.9.
+            value (Optional[float], optional): Valor constante ya validado. Si 
+                es None se usa w_max. Defaults to None.
+        """
+        self.value = w_max if value is None else value
+
+    @classmethod
+    def from_params(cls, w_min: float, w_max: float,
+                    params: Union[List, Tuple] = None) -> "Constant":
+        """Crea la estrategia validando el parámetro opcional [value].
+
+        Args:
+            w_min (float): Valor mínimo del peso inercial.
+            w_max (float): Valor máximo del peso inercial.
             params (Union[List, Tuple], optional): Parámetros específicos:
                 [value] (opcional). Si se proporciona, params[0] será usado
                 como el valor constante. Defaults to None.
 
+        Returns:
+            Constant: Instancia de la estrategia.
+
         Raises:
             ValueError: Si el parámetro 'value' no es un número válido.
         """
         # Si se proporciona un valor específico en params, usarlo
+        value = None
         if params is not None and len(params) > 0:
             try:
                 value = params[0]
@@ -34,14 +55,13 @@ class Constant(InertiaStrategy):
                     raise ValueError(
                         "El parámetro 'value' para constant debe ser un número."
                     )
-                self.value = float(value)
+                value = float(value)
             except (IndexError, ValueError, TypeError) as e:
                 raise ValueError(
                     f"Error al procesar parámetro 'value' para constant: {e}"
                 ) from e
-        else:
-            # Por defecto, usar w_max como valor constante
-            self.value = w_max
+
+        return cls(w_min=w_min, w_max=w_max, value=value)
 
     def __call__(self, current_iteration: int, max_iterations: int,
                  particle_info: Optional[dict] = None) -> float:
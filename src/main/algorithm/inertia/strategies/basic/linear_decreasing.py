@@ -5,17 +5,19 @@ from typing import List, Optional, Tuple, Union
 import numpy as np
 
 from src.main.algorithm.inertia.inertia_registry import InertiaRegistry
-from src.main.algorithm.inertia.inertia_strategy import InertiaStrategy
+from src.main.algorithm.inertia.inertia_strategy import PrecomputedSchedule, normalized_iterations
 
 
 @InertiaRegistry.register("linear_decreasing")
-class LinearDecreasing(InertiaStrategy):
+class LinearDecreasing(PrecomputedSchedule):
     """Implementación de la estrategia de peso inercial decreciente lineal para PSO.
 
     El peso inercial decrece linealmente desde un valor inicial hasta un valor
     final a lo largo de las iteraciones del algoritmo.
     """
 
+    __slots__ = ("w_min", "w_max", "_slope", "_cached_max_it")
+
     def __init__(self, w_min: float = 0.4, w_max: float = 0.9,
                  params: Union[List, Tuple] = None) -> None:
         """Inicializa la estrategia de peso inercial.
@@ -28,6 +30,21 @@ class LinearDecreasing(InertiaStrategy):
         """
         self.w_min = w_min
         self.w_max = w_max
+        self._table = None
+        self._slope = None
+        self._cached_max_it = -1
+
+    def _build_table(self, max_iterations: int) -> np.ndarray:
+        """Calcula el peso inercial de todas las iteraciones.
+
+        Args:
+            max_iterations (int): Número máximo de iteraciones (> 1)
+
+        Returns:
+            np.ndarray: Peso inercial de cada iteración.
+        """
+        g = normalized_iterations(max_iterations)
+        return self.w_max + (self.w_min - self.w_max) * g
 
     def __call__(self, current_iteration: int, max_iterations: int,
                  particle_info: Optional[dict] = None) -> Union[float, np.ndarray]:
@@ -42,11 +59,18 @@ class LinearDecreasing(InertiaStrategy):
         Returns:
             float: Valor del peso inercial para la iteración actual.
         """
+        # Usar la tabla precalculada si corresponde a esta ejecución
+        if self._table is not None and len(self._table) == max_iterations:
+            return self._table[current_iteration]
+
         # Asegurar que no se divida por cero
         if max_iterations <= 1:
             return self.w_min
 
+        # Pendiente (w_min - w_max) / (Max_it - 1), constante durante la ejecución
+        if max_iterations != self._cached_max_it:
+            self._slope = (self.w_min - self.w_max) / (max_iterations - 1)
+            self._cached_max_it = max_iterations
+
         # Calcular el peso inercial decreciente linealmente
-        return self.w_max + (self.w_min - self.w_max) * (
-            current_iteration / (max_iterations - 1)
-        )
+        return self.w_max + self._slope * current_iteration
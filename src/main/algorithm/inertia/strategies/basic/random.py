@@ -1,8 +1,9 @@
 """Implementación de la estrategia de peso inercial aleatorio."""
 
-import random
 from typing import List, Optional, Tuple, Union
 
+import numpy as np
+
 from src.main.algorithm.inertia.inertia_registry import InertiaRegistry
 from src.main.algorithm.inertia.inertia_strategy import InertiaStrategy
 
@@ -11,6 +12,8 @@ from src.main.algorithm.inertia.inertia_strategy import InertiaStrategy
 class Random(InertiaStrategy):
     """Estrategia de peso inercial aleatorio para PSO."""
 
+    __slots__ = ("w_min", "w_max", "_buffer")
+
     def __init__(self, w_min: float = 0.4, w_max: float = 0.9,
                  params: Union[List, Tuple] = None) -> None:
         """Inicializa la estrategia de peso inercial.
@@ -23,6 +26,19 @@ class Random(InertiaStrategy):
         """
         self.w_min = w_min
         self.w_max = w_max
+        self._buffer = None
+
+    def prepare(self, max_iterations: int) -> None:
+        """Genera de una vez los pesos aleatorios de todas las iteraciones.
+
+        El generador se siembra desde el estado global de NumPy, de modo que 
+        las ejecuciones con semilla fija siguen siendo reproducibles.
+
+        Args:
+            max_iterations (int): Número máximo de iteraciones
+        """
+        rng = np.random.default_rng(np.random.randint(2**32, dtype=np.uint64))
+        self._buffer = rng.uniform(self.w_min, self.w_max, size=max_iterations)
 
     def __call__(self, current_iteration: int, max_iterations: int,
                  particle_info: Optional[dict] = None) -> float:
@@ -37,4 +53,7 @@ class Random(InertiaStrategy):
         Returns:
             float: Valor aleatorio del peso inercial entre w_min y w_max.
         """
-        return random.uniform(self.w_min, self.w_max)
+        if self._buffer is None or len(self._buffer) < max_iterations:
+            self.prepare(max_iterations)
+
+        return self._buffer[current_iteration]
@@ -2,12 +2,14 @@
 
 from typing import List, Optional, Tuple, Union
 
+import numpy as np
+
 from src.main.algorithm.inertia.inertia_registry import InertiaRegistry
-from src.main.algorithm.inertia.inertia_strategy import InertiaStrategy
+from src.main.algorithm.inertia.inertia_strategy import PrecomputedSchedule, normalized_iterations
 
 
 @InertiaRegistry.register("concave_decreasing")
-class ConcaveDecreasing(InertiaStrategy):
+class ConcaveDecreasing(PrecomputedSchedule):
     """Implementación de la estrategia de peso inercial cóncava decreciente para PSO.
 
     El peso inercial decrece de forma cóncava según la fórmula:
@@ -17,6 +19,8 @@ class ConcaveDecreasing(InertiaStrategy):
     Esta función decrece más rápido al principio y más lentamente al final.
     """
 
+    __slots__ = ("w_max", "w_min", "_slope", "_span", "_cached_max_it")
+
     def __init__(self, w_min: float = 0.4, w_max: float = 0.9,
                  params: Union[List, Tuple] = None) -> None:
         """Inicializa la estrategia de peso inercial.
@@ -29,6 +33,22 @@ class ConcaveDecreasing(InertiaStrategy):
         """
         self.w_max = w_max
         self.w_min = w_min
+        self._table = None
+        self._slope = None
+        self._span = None
+        self._cached_max_it = -1
+
+    def _build_table(self, max_iterations: int) -> np.ndarray:
+        """Calcula el peso inercial de todas las iteraciones.
+
+        Args:
+            max_iterations (int): Número máximo de iteraciones (> 1)
+
+        Returns:
+            np.ndarray: Peso inercial de cada iteración.
+        """
+        g = normalized_iterations(max_iterations)
+        return -(self.w_max - self.w_min) * (g ** 2) + self.w_max
 
     def __call__(self, current_iteration: int, max_iterations: int,
                  particle_info: Optional[dict] = None) -> float:
@@ -43,13 +63,23 @@ class ConcaveDecreasing(InertiaStrategy):
         Returns:
             float: Valor del peso inercial para la iteración actual.
         """
+        # Usar la tabla precalculada si corresponde a esta ejecución
+        if self._table is not None and len(self._table) == max_iterations:
+            return self._table[current_iteration]
+
         # Asegurar que no se divida por cero
         if max_iterations <= 1:
             return self.w_min
 
+        # Constantes de la ejecución: 1 / (Max_it - 1) y (wmax - wmin)
+        if max_iterations != self._cached_max_it:
+            self._slope = 1.0 / (max_iterations - 1)
+            self._span = self.w_max - self.w_min
+            self._cached_max_it = max_iterations
+
         # Calcular g: relación entre iteración actual y máximo de iteraciones
-        g = current_iteration / (max_iterations - 1)
+        g = current_iteration * self._slope
 
         # Implementación de la función cóncava decreciente:
         # w = -(wmax - wmin)g^2 + wmax
-        return -(self.w_max - self.w_min) * (g ** 2) + self.w_max
+        return self.w_max - self._span * g * g
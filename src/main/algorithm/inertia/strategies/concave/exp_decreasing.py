@@ -3,14 +3,18 @@
 import math
 from typing import Union, List, Tuple, Optional
 
-from src.main.algorithm.inertia.inertia_strategy import InertiaStrategy
+import numpy as np
+
+from src.main.algorithm.inertia.inertia_strategy import PrecomputedSchedule, normalized_iterations
 from src.main.algorithm.inertia.inertia_registry import InertiaRegistry
 
 
 @InertiaRegistry.register("concave_exp_decreasing")
-class ConcaveExponentialDecreasing(InertiaStrategy):
+class ConcaveExponentialDecreasing(PrecomputedSchedule):
     """Implementación de la estrategia de peso inercial cóncava exponencial decreciente para PSO."""
 
+    __slots__ = ("w_max", "w_min", "_c", "_inv_denom")
+
     def __init__(self, w_min: float = 0.4, w_max: float = 0.9, 
                  params: Union[List, Tuple] = None):
         """Inicializa la estrategia de peso inercial.
@@ -23,6 +27,24 @@ class ConcaveExponentialDecreasing(InertiaStrategy):
         """
         self.w_max = w_max
         self.w_min = w_min
+        self._table = None
+
+        # Constante de forma y denominador 1 / (e^c - 1), invariantes
+        self._c = 10
+        self._inv_denom = 1.0 / math.expm1(self._c)
+
+    def _build_table(self, max_iterations: int) -> np.ndarray:
+        """Calcula el peso inercial de todas las iteraciones.
+
+        Args:
+            max_iterations (int): Número máximo de iteraciones (> 1)
+
+        Returns:
+            np.ndarray: Peso inercial de cada iteración.
+        """
+        g = normalized_iterations(max_iterations)
+        ratio = np.expm1(self._c * g) * self._inv_denom
+        return self.w_max - (self.w_max - self.w_min) * ratio
 
     def __call__(self, current_iteration: int, max_iterations: int, 
                  particle_info: Optional[dict] = None) -> float:
@@ -37,18 +59,21 @@ class ConcaveExponentialDecreasing(InertiaStrategy):
         Returns:
             float: Valor del peso inercial para la iteración actual
         """
+        # Usar la tabla precalculada si corresponde a esta ejecución
+        if self._table is not None and len(self._table) == max_iterations:
+            return self._table[current_iteration]
+
         # Asegurar que no se divida por cero
         if max_iterations <= 1:
             return self.w_min
             
         # Calcular g como la relación entre iteración actual y máximo de iteraciones
         g = current_iteration / (max_iterations - 1)
-        c = 10
         
         # Formula: w = w_max - (w_max - w_min)*((e^cg - 1)/(e^c - 1))
-        numerator = math.exp(c * g) - 1
-        denominator = math.exp(c) - 1
+        # con (e^c - 1) precalculado como su inverso
+        ratio = math.expm1(self._c * g) * self._inv_denom
         
-        w = self.w_max - (self.w_max - self.w_min) * (numerator / denominator)
+        w = self.w_max - (self.w_max - self.w_min) * ratio
         
         return w
@@ -1,14 +1,19 @@
 """Implementación de la estrategia de peso inercial convexa decreciente."""
 
 from typing import Union, List, Tuple, Optional
-from src.main.algorithm.inertia.inertia_strategy import InertiaStrategy
+
+import numpy as np
+
+from src.main.algorithm.inertia.inertia_strategy import PrecomputedSchedule, normalized_iterations
 from src.main.algorithm.inertia.inertia_registry import InertiaRegistry
 
 
 @InertiaRegistry.register("convex_decreasing")
-class ConvexDecreasing(InertiaStrategy):
+class ConvexDecreasing(PrecomputedSchedule):
     """Implementación de la estrategia de peso inercial convexa decreciente para PSO."""
 
+    __slots__ = ("w_max", "w_min")
+
     def __init__(self, w_min: float = 0.4, w_max: float = 0.9, 
                  params: Union[List, Tuple] = None):
         """Inicializa la estrategia de peso inercial.
@@ -21,6 +26,19 @@ class ConvexDecreasing(InertiaStrategy):
         """
         self.w_max = w_max
         self.w_min = w_min
+        self._table = None
+
+    def _build_table(self, max_iterations: int) -> np.ndarray:
+        """Calcula el peso inercial de todas las iteraciones.
+
+        Args:
+            max_iterations (int): Número máximo de iteraciones (> 1)
+
+        Returns:
+            np.ndarray: Peso inercial de cada iteración.
+        """
+        g = normalized_iterations(max_iterations)
+        return (self.w_max - self.w_min) * ((g - 1) ** 2) + self.w_min
 
     def __call__(self, current_iteration: int, max_iterations: int, 
                  particle_info: Optional[dict] = None) -> float:
@@ -35,6 +53,10 @@ class ConvexDecreasing(InertiaStrategy):
         Returns:
             float: Valor del peso inercial para la iteración actual
         """
+        # Usar la tabla precalculada si corresponde a esta ejecución
+        if self._table is not None and len(self._table) == max_iterations:
+            return self._table[current_iteration]
+
         # Asegurar que no se divida por cero
         if max_iterations <= 1:
             return self.w_min
@@ -2,14 +2,18 @@
 
 from typing import Union, List, Tuple, Optional
 
-from src.main.algorithm.inertia.inertia_strategy import InertiaStrategy
+import numpy as np
+
+from src.main.algorithm.inertia.inertia_strategy import PrecomputedSchedule, normalized_iterations
 from src.main.algorithm.inertia.inertia_registry import InertiaRegistry
 
 
 @InertiaRegistry.register("convex_exp_decreasing")
-class ConvexExponentialDecreasing(InertiaStrategy):
+class ConvexExponentialDecreasing(PrecomputedSchedule):
     """Implementación de la estrategia de peso inercial convexa exponencial decreciente para PSO."""
 
+    __slots__ = ("w_max", "w_min")
+
     def __init__(self, w_min: float = 0.4, w_max: float = 0.9, 
                  params: Union[List, Tuple] = None):
         """Inicializa la estrategia de peso inercial.
@@ -22,6 +26,22 @@ class ConvexExponentialDecreasing(InertiaStrategy):
         """
         self.w_max = w_max
         self.w_min = w_min
+        self._table = None
+
+    def _build_table(self, max_iterations: int) -> np.ndarray:
+        """Calcula el peso inercial de todas las iteraciones.
+
+        Args:
+            max_iterations (int): Número máximo de iteraciones (> 1)
+
+        Returns:
+            np.ndarray: Peso inercial de cada iteración.
+        """
+        g = normalized_iterations(max_iterations)
+        c = 10
+        base = self.w_max / self.w_min
+        exponent = 1 / (1 + c*g)
+        return self.w_min * (base ** exponent)
 
     def __call__(self, current_iteration: int, max_iterations: int, 
                  particle_info: Optional[dict] = None) -> float:
@@ -36,6 +56,10 @@ class ConvexExponentialDecreasing(InertiaStrategy):
         Returns:
             float: Valor del peso inercial para la iteración actual
         """
+        # Usar la tabla precalculada si corresponde a esta ejecución
+        if self._table is not None and len(self._table) == max_iterations:
+            return self._table[current_iteration]
+
         # Asegurar que no se divida por cero
         if max_iterations <= 1:
             return self.w_min
@@ -5,12 +5,61 @@ from typing import Any, Callable, Dict, Tuple
 import numpy as np
 
 
+def apply_bounce(
+    position: np.ndarray,
+    velocity: np.ndarray,
+    bounds: Tuple[float, float],
+    xp=np,
+) -> None:
+    """Aplica el mecanismo de rebote en el sitio sobre posiciones y velocidades.
+
+    Funciona tanto para el vector de una partícula como para la matriz 
+    (n_partículas, dimensiones) de todo el enjambre. Si una coordenada 
+    sobrepasa un límite, se refleja respecto a él y su velocidad se invierte 
+    con amortiguación.
+
+    Args:
+        position (np.ndarray): Posición(es) a corregir; se modifica en el sitio.
+        velocity (np.ndarray): Velocidad(es) asociadas; se modifica en el sitio.
+        bounds (Tuple[float, float]): Tupla (min, max) con los límites del 
+            espacio de búsqueda.
+        xp (module, optional): Módulo de arrays de los datos (NumPy o CuPy). 
+            Defaults to np.
+    """
+    lower_bound, upper_bound = bounds
+
+    # Exceso respecto al límite sobrepasado, con signo: positivo por debajo 
+    # del mínimo, negativo por encima del máximo y cero dentro de los límites
+    excess = xp.maximum(lower_bound - position, 0.0)
+    excess -= xp.maximum(position - upper_bound, 0.0)
+    bounced = excess != 0
+
+    # Caso habitual: ninguna coordenada fuera de los límites
+    if not bounced.any():
+        return
+
+    # Rebote: reflejar la posición respecto al límite sobrepasado (sin 
+    # máscaras: el exceso es nulo en las coordenadas que no rebotan)
+    excess *= 2.0
+    position += excess
+
+    # Invertir la velocidad de las coordenadas que rebotaron
+    velocity *= xp.where(bounced, -0.8, 1.0)  # Amortiguación en el rebote
+
+    # Verificar que la posición siga dentro de los límites después del rebote
+    # (por si acaso el rebote pone la partícula fuera de los límites otra vez)
+    xp.clip(position, lower_bound, upper_bound, out=position)
+
+
 class PSOParticle:
     """Partícula para el algoritmo PSO (Particle Swarm Optimization).
     
     Almacena posición, velocidad, fitness y mejor posición histórica.
     """
 
+    __slots__ = ("dimensions", "bounds", "velocity_bounds", "position", 
+                 "velocity", "fitness", "best_position", "best_fitness")
+
     def __init__(
         self,
         dimensions: int,
@@ -87,24 +136,7 @@ class PSOParticle:
         Si la partícula sobrepasa un límite, rebota invirtiendo la dirección de 
         la velocidad.
         """
-        lower_bound, upper_bound = self.bounds
-
-        for i in range(self.dimensions):
-            # Comprobar límite inferior
-            if self.position[i] < lower_bound:
-                # Rebote: invertir la velocidad y colocar en el límite
-                self.position[i] = lower_bound + (lower_bound - self.position[i])
-                self.velocity[i] = -self.velocity[i] * 0.8  # Amortiguación en el rebote
-
-            # Comprobar límite superior
-            elif self.position[i] > upper_bound:
-                # Rebote: invertir la velocidad y colocar en el límite
-                self.position[i] = upper_bound - (self.position[i] - upper_bound)
-                self.velocity[i] = -self.velocity[i] * 0.8  # Amortiguación en el rebote
-
-        # Verificar que la posición siga dentro de los límites después del rebote
-        # (por si acaso el rebote pone la partícula fuera de los límites otra vez)
-        self.position = np.clip(self.position, lower_bound, upper_bound)
+        apply_bounce(self.position, self.velocity, self.bounds)
 
     def evaluate(self, objective_function: Callable[[np.ndarray], float]) -> float:
         """Evalúa la partícula con la función objetivo.
@@ -1,11 +1,13 @@
 """Implementación del algoritmo Particle Swarm Optimization (PSO)."""
 
-from typing import Any, Dict, List, Union
+import multiprocessing
+from typing import Any, Dict, Optional, Union
 
 import numpy as np
 from tqdm import tqdm
 
-from src.main.algorithm.particle import PSOParticle
+from src.main.algorithm.inertia.inertia_strategy import build_w_sequence
+from src.main.algorithm.swarm import UPDATE_MODES, SwarmState, get_batch_evaluator
 from src.main.core.solution import Solution
 from src.main.utils.constants import PSO_STATS_SAVE_INTERVAL
 
@@ -17,6 +19,8 @@ class PSO:
         self,
         config: Dict[str, Any],
         show_progress: bool = True,
+        seed: Optional[int] = None,
+        n_processes: int = 1,
     ) -> None:
         """Inicializa el algoritmo PSO.
 
@@ -24,12 +28,29 @@ class PSO:
             config (Dict[str, Any]): Diccionario con la configuración ya validada.
             show_progress (bool, optional): Si se debe mostrar barra de progreso. 
                 Defaults to True.
+            seed (Optional[int], optional): Semilla del generador del enjambre. 
+                Si es None se obtiene del generador global de NumPy, de modo 
+                que np.random.seed sigue haciendo reproducible la ejecución. 
+                Los coeficientes y pesos inerciales aleatorios se generan 
+                siempre desde el generador global, por lo que reproducir una 
+                ejecución completa requiere fijar también np.random.seed 
+                (como hace run_one). Defaults to None.
+            n_processes (int, optional): Número de procesos para evaluar las 
+                partículas en paralelo. Solo se usa en el modo de actualización 
+                "synchronous" y con funciones objetivo no vectorizadas 
+                (costosas, de caja negra), que deben poder serializarse con 
+                pickle. Defaults to 1.
+
+        Raises:
+            ValueError: Si el modo de actualización no es válido.
         """
         # Extraer parámetros de la configuración
         self.dimensions = config["dimensions"]
         self.population_size = config["population_size"]
         self.generations = config["generations"]
         self.show_progress = show_progress
+        self.seed = seed
+        self.n_processes = n_processes
 
         # Usar componentes ya validados y creados
         self.bounds = config["bounds"]
@@ -38,12 +59,54 @@ class PSO:
         self.c1_strategy = config["c1_strategy"]
         self.c2_strategy = config["c2_strategy"]
         self.inertia_strategy = config["inertia_strategy"]
+        self.backend = config.get("backend", "numpy")
+        self.dtype = config.get("dtype", "float64")
+
+        # "asynchronous": cada partícula se mueve y evalúa por turnos y la 
+        # mejor global se actualiza al momento (PSO clásico). "synchronous": 
+        # todo el enjambre se mueve y evalúa a la vez con la mejor global de 
+        # la generación anterior; es vectorizado pero converge más despacio
+        self.update_mode = config.get("update_mode", "asynchronous")
+        if self.update_mode not in UPDATE_MODES:
+            raise ValueError(
+                f"Unsupported update mode: {self.update_mode}. "
+                f"Valid options: {UPDATE_MODES}"
+            )
+
+        # Valores de los coeficientes por iteración (se calculan en run)
+        self._c1_schedule: np.ndarray = None
+        self._c2_schedule: np.ndarray = None
+
+        # Peso inercial de todas las iteraciones, si la estrategia no depende 
+        # de las partículas (se calcula en run)
+        self._w_schedule: np.ndarray = None
+
+        # Propiedades de la estrategia de inercia, fijas durante la ejecución
+        self._inertia_returns_array = self.inertia_strategy.returns_array
+        self._inertia_needs_info = self.inertia_strategy.requires_particle_info
+
+        # Indica si en la iteración actual se registran estadísticas
+        self._save_stats = False
+
+        # Pool de procesos para evaluar las partículas (solo durante run)
+        self._pool = None
 
         # Inicializar estado
         self.iteration = 0
-        self.particles: List[PSOParticle] = []
+        self.swarm: SwarmState = None
         self.best_solution: Solution = None
 
+        # Muestras de estadísticas preasignadas (una cada 
+        # PSO_STATS_SAVE_INTERVAL generaciones más la última); se vuelcan en 
+        # self.history al terminar la ejecución
+        n_samples = -(-self.generations // PSO_STATS_SAVE_INTERVAL) + 1
+        self._sample_count = 0
+        self._best_fitness_samples = np.empty(n_samples)
+        self._avg_fitness_samples = np.empty(n_samples)
+        self._inertia_samples = np.empty(n_samples)
+        # Filas: diversidad de velocidad, de posición y cognitiva
+        self._diversity_samples = np.empty((3, n_samples))
+
         # Historial de estadísticas para visualización
         self.history = {
             "best_fitness_per_generation": [],
@@ -61,67 +124,93 @@ class PSO:
             Dict[str, Any]: Estadísticas de la ejecución, incluyendo la mejor 
                 solución.
         """
+        # Solo la actualización síncrona evalúa el enjambre completo de una 
+        # vez. Las funciones vectorizadas lo hacen en una llamada, más rápido 
+        # que repartir las partículas entre procesos
+        if (self.update_mode == "synchronous" and self.n_processes > 1
+                and get_batch_evaluator(self.objective_function) is None):
+            self._pool = multiprocessing.Pool(self.n_processes)
+
+        try:
+            return self._run_generations()
+        finally:
+            if self._pool is not None:
+                self._pool.close()
+                self._pool.join()
+                self._pool = None
+
+    def _run_generations(self) -> Dict[str, Any]:
+        """Inicializa el enjambre y ejecuta todas las generaciones.
+
+        Returns:
+            Dict[str, Any]: Estadísticas de la ejecución.
+        """
         self.initialize_particles()
 
-        # Crear barra de progreso si está habilitada
-        progress_bar = None
+        # Precalcular los coeficientes y, si es posible, el peso inercial de 
+        # todas las iteraciones
+        self._c1_schedule = self.c1_strategy.precompute(self.generations)
+        self._c2_schedule = self.c2_strategy.precompute(self.generations)
+        self._w_schedule = build_w_sequence(self.inertia_strategy, self.generations)
+        if self._w_schedule is None:
+            self.inertia_strategy.prepare(self.generations)
+
+        # Iterar para cada generación; si la barra de progreso está 
+        # habilitada, envuelve al rango y se redibuja como mucho cada 
+        # mininterval segundos (y cada 1% de las generaciones)
+        generations = range(self.generations)
         if self.show_progress:
-            progress_bar = tqdm(total=self.generations, desc="PSO progreso")
+            generations = tqdm(
+                generations, desc="PSO progreso", mininterval=0.5,
+                miniters=max(1, self.generations // 100)
+            )
 
-        # Iterar para cada generación
-        for i in range(self.generations):
+        for i in generations:
             self.iteration = i
             self._update_generation()
 
-            # Actualizar la barra de progreso
-            if progress_bar:
-                progress_bar.update(1)
-
-        # Cerrar la barra de progreso si está habilitada
-        if progress_bar:
-            progress_bar.close()
-
         return self.get_stats()
 
     def initialize_particles(self) -> None:
-        """Inicializa la población de partículas y configura el estado inicial.
+        """Inicializa el enjambre y configura el estado inicial.
         
-        Optimizado para encontrar la mejor partícula durante la inicialización.
+        Todas las partículas se guardan en las matrices de un SwarmState.
         """
-        self.particles = []
-        best_particle = None
-        best_fitness = float('inf')
-
-        # Crear y evaluar partículas iniciales
-        for _ in range(self.population_size):
-            particle = PSOParticle(
-                dimensions=self.dimensions,
-                bounds=self.bounds,
-                velocity_bounds=self.velocity_bounds,
-            )
-
-            # Evaluar la partícula
-            fitness = particle.evaluate(self.objective_function)
-            self.particles.append(particle)
-
-            # Actualizar mejor partícula si es necesario
-            if fitness < best_fitness:
-                best_fitness = fitness
-                best_particle = particle
+        seed = self.seed
+        if seed is None:
+            seed = np.random.randint(2**32, dtype=np.uint64)
+
+        self.swarm = SwarmState(
+            size=self.population_size,
+            dimensions=self.dimensions,
+            bounds=self.bounds,
+            velocity_bounds=self.velocity_bounds,
+            seed=seed,
+            backend=self.backend,
+            dtype=self.dtype,
+        )
+
+        # Evaluar las partículas iniciales
+        fitness = self.swarm.evaluate(self.objective_function, self._map_function())
 
         # Configurar mejor solución global directamente
-        if best_particle:
-            self.best_solution = Solution(
-                fitness=best_particle.fitness,
-                position=np.copy(best_particle.position),
-                velocity=np.copy(best_particle.velocity)
-            )
+        # (la mejor solución se guarda siempre en memoria del host)
+        swarm = self.swarm
+        best_index = int(swarm.xp.argmin(fitness))
+        self.best_solution = Solution(
+            fitness=float(fitness[best_index]),
+            position=swarm.to_host(swarm.positions[best_index])
+        )
 
     def _update_generation(self) -> None:
         """Actualiza la población para una iteración del algoritmo PSO."""
+        # Decidir una sola vez si esta iteración registra estadísticas
+        self._save_stats = (self.iteration % PSO_STATS_SAVE_INTERVAL == 0 or 
+                            self.iteration + 1 == self.generations)
+
         # Calcular coeficientes para la iteración actual
-        c1_value = self.c1_strategy(self.iteration, self.generations)
-        c2_value = self.c2_strategy(self.iteration, self.generations)
+        c1_value = self._c1_schedule[self.iteration]
+        c2_value = self._c2_schedule[self.iteration]
 
         # Obtener el peso inercial para esta iteración (para toda la población 
         # o por partícula)
@@ -133,6 +222,29 @@ class PSO:
     def _compute_inertia_weights(self) -> Union[float, np.ndarray]:
         """Calcula los pesos inerciales para la iteración actual.
         
+        Returns:
+            Union[float, np.ndarray]: Un único valor de peso inercial o un array 
+                con valores para cada partícula.
+        """
+        # Peso precalculado en run() para las estrategias que solo dependen 
+        # de la iteración
+        if self._w_schedule is not None:
+            w_values = self._w_schedule[self.iteration]
+        else:
+            w_values = self._evaluate_inertia_strategy()
+
+        # Guardar el valor de inercia para estadísticas
+        if self._save_stats:
+            if self._inertia_returns_array:
+                self._inertia_samples[self._sample_count] = np.mean(w_values)
+            else:
+                self._inertia_samples[self._sample_count] = w_values
+
+        return w_values
+
+    def _evaluate_inertia_strategy(self) -> Union[float, np.ndarray]:
+        """Invoca la estrategia de inercia para la iteración actual.
+
         Returns:
             Union[float, np.ndarray]: Un único valor de peso inercial o un array 
                 con valores para cada partícula.
@@ -140,10 +252,12 @@ class PSO:
         # Preparar información del estado actual para la estrategia de inercia 
         # si la necesita
         particle_info = None
-        if self.inertia_strategy.requires_particle_info:
+        if self._inertia_needs_info:
             # Recolectar la información específica que esta estrategia necesita
             pso_state = {
-                'particles': self.particles,
+                'swarm': self.swarm,
+                'particles': self.swarm.particles,
+                'best_positions': self.swarm.to_host(self.swarm.best_positions),
                 'best_solution': self.best_solution,
                 'iteration': self.iteration,
                 'generations': self.generations,
@@ -152,22 +266,44 @@ class PSO:
             particle_info = self.inertia_strategy.collect_required_info(pso_state)
 
         # Calcular los pesos inerciales
-        w_values = self.inertia_strategy(self.iteration, self.generations, 
-                                         particle_info)
-
-        # Guardar el valor de inercia para estadísticas
-        if (self.iteration % PSO_STATS_SAVE_INTERVAL == 0 or 
-            self.iteration + 1 == self.generations):
-            if self.inertia_strategy.returns_array:
-                self.history["inertia_weight"].append(np.mean(w_values))
-            else:
-                self.history["inertia_weight"].append(w_values)
-
-        return w_values
+        return self.inertia_strategy(self.iteration, self.generations, 
+                                     particle_info)
 
     def _update_particles(self, w_values: Union[float, np.ndarray], 
                          c1_value: float, c2_value: float) -> None:
-        """Actualiza la posición, velocidad y fitness de cada partícula.
+        """Actualiza la posición, velocidad y fitness de todo el enjambre.
+
+        Args:
+            w_values (Union[float, np.ndarray]): Valor(es) de peso inercial para 
+                la iteración actual.
+            c1_value (float): Valor del coeficiente cognitivo para la iteración 
+                actual.
+            c2_value (float): Valor del coeficiente social para la iteración 
+                actual.
+        """
+        swarm = self.swarm
+        best_solution = self.best_solution
+
+        if self.update_mode == "asynchronous":
+            # Mover y evaluar cada partícula por turnos; la mejor solución se 
+            # actualiza en el sitio en cuanto una partícula la mejora
+            best_solution.fitness = swarm.step_asynchronous(
+                best_solution.position, best_solution.fitness, 
+                w_values, c1_value, c2_value, self.objective_function
+            )
+        else:
+            self._update_swarm_synchronous(w_values, c1_value, c2_value)
+
+        # Actualizar estadísticas para esta iteración
+        if self._save_stats:
+            self._update_history()
+
+    def _update_swarm_synchronous(self, w_values: Union[float, np.ndarray], 
+                                  c1_value: float, c2_value: float) -> None:
+        """Actualiza y evalúa todo el enjambre a la vez.
+
+        Todas las partículas se orientan hacia la mejor posición global de la 
+        generación anterior, que se actualiza tras evaluar el enjambre.
 
         Args:
             w_values (Union[float, np.ndarray]): Valor(es) de peso inercial para 
@@ -177,68 +313,50 @@ class PSO:
             c2_value (float): Valor del coeficiente social para la iteración 
                 actual.
         """
+        swarm = self.swarm
 
-        # Actualizar cada partícula
-        for i, particle in enumerate(self.particles):
-            # Seleccionar el peso inercial para esta partícula
-            w = w_values[i] if self.inertia_strategy.returns_array else w_values
+        # Actualizar velocidad y posición de todas las partículas a la vez
+        swarm.update(self.best_solution.position, w_values, c1_value, c2_value)
 
-            # Actualizar velocidad y posición
-            particle.update(self.best_solution.position, w, c1_value, c2_value)
+        # Evaluar las nuevas posiciones
+        fitness = swarm.evaluate(self.objective_function, self._map_function())
 
-            # Evaluar la nueva posición
-            fitness = particle.evaluate(self.objective_function)
+        # Actualizar la mejor solución global si es necesario
+        # (se copia en los arrays de la solución existente, sin crear otra)
+        best_index = int(swarm.xp.argmin(fitness))
+        best_fitness = float(fitness[best_index])
+        best_solution = self.best_solution
+        if best_fitness < best_solution.fitness:
+            np.copyto(best_solution.position, swarm.to_host(swarm.positions[best_index]))
+            best_solution.fitness = best_fitness
 
-            # Actualizar la mejor solución global si es necesario
-            if fitness < self.best_solution.fitness:
-                self.best_solution = Solution(
-                    position=np.copy(particle.position),
-                    fitness=fitness,
-                    velocity=np.copy(particle.velocity)
-                )
+    def _map_function(self):
+        """Devuelve la función map del pool de procesos, si está activo.
 
-        # Actualizar estadísticas para esta iteración
-        if (self.iteration % PSO_STATS_SAVE_INTERVAL == 0 or 
-            self.iteration + 1 == self.generations):
-            self._update_history()
+        Returns:
+            Optional[Callable]: ``Pool.map`` o None si se evalúa en serie.
+        """
+        return self._pool.map if self._pool is not None else None
 
     def _update_history(self) -> None:
         """Actualiza el historial de estadísticas del algoritmo."""
-        # Extraer valores de fitness para cálculos
-        fitness_values = np.array([p.fitness for p in self.particles])
+        swarm = self.swarm
+        sample = self._sample_count
 
         # Calcular y almacenar estadísticas básicas
-        self.history["best_fitness_per_generation"].append(
-            self.best_solution.fitness)
-        self.history["avg_fitness_per_generation"].append(
-            np.mean(fitness_values))
-
-        # Calcular la partícula promedio (posición, velocidad y mejor posición 
-        # personal)
-        avg_position = np.mean([p.position for p in self.particles], axis=0)
-        avg_velocity = np.mean([p.velocity for p in self.particles], axis=0)
-        avg_best_position = np.mean([p.best_position for p in self.particles], 
-                                    axis=0)
-
-        # Calcular diversidad de la población usando la partícula promedio como 
-        # referencia
-        diversity_velocity = np.mean([
-            np.linalg.norm(p.velocity - avg_velocity, ord=1) 
-            for p in self.particles
-        ])
-        diversity_position = np.mean([
-            np.linalg.norm(p.position - avg_position, ord=1) 
-            for p in self.particles
-        ])
-        diversity_cognitive = np.mean([
-            np.linalg.norm(p.best_position - avg_best_position, ord=1) 
-            for p in self.particles
-        ])
-
-        # Almacenar diversidad en el historial
-        self.history["diversity"]["velocity"].append(diversity_velocity)
-        self.history["diversity"]["position"].append(diversity_position)
-        self.history["diversity"]["cognitive"].append(diversity_cognitive)
+        self._best_fitness_samples[sample] = self.best_solution.fitness
+        self._avg_fitness_samples[sample] = float(swarm.fitness.mean())
+
+        # Calcular diversidad de la población (velocidad, posición y mejor 
+        # posición personal) usando la partícula promedio como referencia
+        diversity = self._diversity_samples[:, sample]
+        diversity[0] = swarm.diversity(swarm.velocities)
+        diversity[1] = swarm.diversity(swarm.positions)
+        diversity[2] = swarm.diversity(swarm.best_positions)
+
+        # La muestra de inercia de esta iteración ya se guardó en 
+        # _compute_inertia_weights; pasar a la siguiente
+        self._sample_count = sample + 1
 
     def get_stats(self) -> Dict[str, Any]:
         """Devuelve estadísticas del algoritmo PSO.
@@ -246,6 +364,17 @@ class PSO:
         Returns:
             Dict[str, Any]: Diccionario con estadísticas del algoritmo.
         """
+        # Volcar las muestras registradas en el historial (listas aptas para 
+        # JSON)
+        n = self._sample_count
+        velocity, position, cognitive = self._diversity_samples[:, :n].tolist()
+        self.history["best_fitness_per_generation"] = self._best_fitness_samples[:n].tolist()
+        self.history["avg_fitness_per_generation"] = self._avg_fitness_samples[:n].tolist()
+        self.history["inertia_weight"] = self._inertia_samples[:n].tolist()
+        self.history["diversity"] = {
+            "velocity": velocity, "position": position, "cognitive": cognitive
+        }
+
         # Para visualizaciones
         self.history["generations"] = self.generations
         return {
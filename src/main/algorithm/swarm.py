@@ -0,0 +1,488 @@
+"""Estado del enjambre PSO almacenado como estructura de arrays (SoA)."""
+
+from typing import Callable, List, Optional, Tuple, Union
+
+import numpy as np
+
+from src.main.algorithm.particle import apply_bounce
+
+# Backends de arrays soportados por el enjambre
+ARRAY_BACKENDS = ("numpy", "cupy")
+
+# Tipos de dato admitidos para el estado del enjambre
+STATE_DTYPES = ("float64", "float32")
+
+# Tamaño objetivo (en bytes) del bloque de filas de cada matriz que se 
+# actualiza de una vez, para que permanezca en la caché L1
+TILE_BYTES = 32 * 1024
+
+# Número de generaciones cuyos componentes aleatorios se generan de una vez
+RANDOM_BLOCK_GENERATIONS = 64
+
+# Formas de actualizar el enjambre en cada generación: partícula a partícula,
+# con la mejor global al día (clásica), o todo el enjambre a la vez
+UPDATE_MODES = ("asynchronous", "synchronous")
+
+
+def get_array_module(backend: str = "numpy"):
+    """Devuelve el módulo de arrays (NumPy o CuPy) para un backend.
+
+    CuPy se importa solo cuando se solicita, ya que es una dependencia 
+    opcional.
+
+    Args:
+        backend (str, optional): Nombre del backend. Defaults to "numpy".
+
+    Returns:
+        module: Módulo compatible con la API de NumPy.
+
+    Raises:
+        ValueError: Si el backend no es válido o CuPy no está instalado.
+    """
+    if backend == "numpy":
+        return np
+    if backend == "cupy":
+        try:
+            import cupy
+        except ImportError as e:
+            raise ValueError("The 'cupy' backend requires CuPy to be installed") from e
+        return cupy
+    raise ValueError(
+        f"Unsupported array backend: {backend}. Valid options: {ARRAY_BACKENDS}"
+    )
+
+
+def get_batch_evaluator(
+    objective_function: Callable,
+) -> Optional[Callable[[np.ndarray], np.ndarray]]:
+    """Devuelve la forma de evaluar todo el enjambre en una sola llamada.
+
+    Args:
+        objective_function (Callable): Función objetivo.
+
+    Returns:
+        Optional[Callable[[np.ndarray], np.ndarray]]: Su método 
+            ``batch_evaluate`` (como en las funciones benchmark), la propia 
+            función si tiene el atributo ``vectorized = True``, o None si 
+            solo evalúa posiciones de una en una.
+    """
+    batch_evaluate = getattr(objective_function, "batch_evaluate", None)
+    if batch_evaluate is None and getattr(objective_function, "vectorized", False):
+        batch_evaluate = objective_function
+    return batch_evaluate
+
+
+class SwarmState:
+    """Estado completo del enjambre en formato Structure-of-Arrays.
+
+    En lugar de un objeto por partícula, las posiciones, velocidades, aptitudes 
+    y mejores posiciones personales de todas las partículas se guardan en 
+    matrices contiguas, de modo que la actualización del enjambre se resuelve 
+    con unas pocas operaciones vectorizadas de NumPy. Con el backend "cupy" 
+    las matrices residen en la GPU y solo las posiciones se copian al host 
+    para evaluar la función objetivo.
+
+    Attributes:
+        positions (np.ndarray): Matriz (n_partículas, dimensiones) de posiciones.
+        velocities (np.ndarray): Matriz (n_partículas, dimensiones) de velocidades.
+        fitness (np.ndarray): Vector (n_partículas,) con la aptitud actual.
+        best_positions (np.ndarray): Matriz (n_partículas, dimensiones) con la 
+            mejor posición histórica de cada partícula.
+        best_fitness (np.ndarray): Vector (n_partículas,) con la mejor aptitud 
+            histórica de cada partícula.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        dimensions: int,
+        bounds: Tuple[float, float],
+        velocity_bounds: Tuple[float, float],
+        seed: Optional[int] = None,
+        backend: str = "numpy",
+        dtype=np.float64,
+    ) -> None:
+        """Inicializa el enjambre con posiciones y velocidades aleatorias.
+
+        Args:
+            size (int): Número de partículas.
+            dimensions (int): Número de dimensiones del espacio de búsqueda.
+            bounds (Tuple[float, float]): Tupla (min, max) con los límites del 
+                espacio de búsqueda.
+            velocity_bounds (Tuple[float, float]): Tupla (min, max) con los 
+                límites de velocidad.
+            seed (Optional[int], optional): Semilla del generador aleatorio 
+                propio del enjambre. Defaults to None.
+            backend (str, optional): Backend de arrays, "numpy" o "cupy". 
+                Defaults to "numpy".
+            dtype (optional): Tipo de dato de posiciones, velocidades y 
+                mejores posiciones (np.float64 o np.float32). Las aptitudes 
+                se guardan siempre en float64. Defaults to np.float64.
+
+        Raises:
+            ValueError: Si el backend no es válido o no está disponible, o si 
+                el tipo de dato no es float32 ni float64.
+        """
+        self.xp = xp = get_array_module(backend)
+        self.backend = backend
+        self.dtype = np.dtype(dtype)
+        if self.dtype.name not in STATE_DTYPES:
+            raise ValueError(
+                f"Swarm dtype must be float32 or float64, got: {self.dtype}"
+            )
+        self.size = size
+        self.dimensions = dimensions
+        self.bounds = bounds
+        self.velocity_bounds = velocity_bounds
+
+        lower_bound, upper_bound = bounds
+        lower_vel, upper_vel = velocity_bounds
+        shape = (size, dimensions)
+
+        # Límites como escalares de Python, desempaquetados una sola vez para 
+        # los recortes en el sitio de cada actualización
+        self._position_limits = (float(lower_bound), float(upper_bound))
+        self._velocity_limits = (float(lower_vel), float(upper_vel))
+
+        # Generador propio: los números aleatorios se piden en bloques
+        self._rng = xp.random.default_rng(seed)
+
+        # Inicializar posiciones y velocidades aleatorias dentro de los límites
+        self.positions = self._rng.uniform(
+            low=lower_bound, high=upper_bound, size=shape
+        ).astype(self.dtype, copy=False)
+        self.velocities = self._rng.uniform(
+            low=lower_vel, high=upper_vel, size=shape
+        ).astype(self.dtype, copy=False)
+
+        # Inicializar valores de fitness
+        self.fitness = xp.full(size, float("inf"))
+        self.best_positions = xp.copy(self.positions)
+        self.best_fitness = xp.full(size, float("inf"))
+
+        # Componentes aleatorios de las próximas generaciones, generados en 
+        # bloques de RANDOM_BLOCK_GENERATIONS (se rellena en el primer update)
+        self._random_block = xp.empty((0, size, 2), dtype=self.dtype)
+        self._random_index = 0
+
+        # Matriz auxiliar reutilizada en cada actualización (sin temporales)
+        self._scratch = xp.empty(shape, dtype=self.dtype)
+
+        # Filas por bloque en la actualización. En la GPU se procesa todo el 
+        # enjambre de una vez, ya que cada bloque supone lanzar más kernels
+        if xp is np:
+            self._tile_rows = max(1, TILE_BYTES // (dimensions * self.dtype.itemsize))
+        else:
+            self._tile_rows = size
+
+        # Vistas por partícula, creadas solo si se piden
+        self._particles = None
+
+    def to_host(self, array):
+        """Devuelve un array del enjambre como np.ndarray en memoria del host.
+
+        Con el backend "numpy" se devuelve el mismo array, sin copia.
+
+        Args:
+            array: Array del enjambre.
+
+        Returns:
+            np.ndarray: Array en memoria del host.
+        """
+        return array if self.xp is np else self.xp.asnumpy(array)
+
+    def diversity(self, array) -> float:
+        """Calcula la diversidad de una matriz del enjambre.
+
+        Es la media de la distancia L1 de cada partícula a la partícula 
+        promedio. Se calcula sobre la matriz auxiliar, sin temporales del 
+        tamaño del enjambre.
+
+        Args:
+            array: Matriz (n_partículas, dimensiones) del enjambre (posiciones, 
+                velocidades o mejores posiciones).
+
+        Returns:
+            float: Diversidad de la matriz.
+        """
+        xp = self.xp
+        scratch = self._scratch
+        xp.subtract(array, array.mean(axis=0), out=scratch)
+        xp.abs(scratch, out=scratch)
+        return float(scratch.sum(axis=1).mean())
+
+    @property
+    def particles(self) -> List["ParticleView"]:
+        """Lista de vistas por partícula sobre las matrices del enjambre.
+
+        Se crea una sola vez; cada vista lee siempre los valores actuales.
+
+        Returns:
+            List[ParticleView]: Una vista por partícula, en orden.
+        """
+        if self._particles is None:
+            self._particles = [ParticleView(self, i) for i in range(self.size)]
+        return self._particles
+
+    def update(
+        self,
+        global_best_position: np.ndarray,
+        w: Union[float, np.ndarray],
+        c1: float,
+        c2: float,
+    ) -> None:
+        """Actualiza velocidades y posiciones de todo el enjambre en el sitio.
+
+        Todas las partículas usan la misma mejor posición global (actualización 
+        síncrona). Las partículas se procesan en bloques de filas que caben en 
+        la caché, de modo que cada bloque recorre toda la actualización 
+        (velocidad, límite, posición y rebote) antes de pasar al siguiente.
+
+        Args:
+            global_best_position (np.ndarray): Mejor posición global encontrada 
+                por el enjambre.
+            w (Union[float, np.ndarray]): Factor de inercia, común o uno por 
+                partícula.
+            c1 (float): Coeficiente cognitivo (peso de la experiencia personal).
+            c2 (float): Coeficiente social (peso de la experiencia del enjambre).
+        """
+        c1_r1, c2_r2 = self._random_factors(c1, c2)
+
+        # Un peso por partícula se aplica a toda su fila
+        per_particle_w = np.ndim(w) == 1
+        if per_particle_w:
+            w = self.xp.asarray(w)[:, np.newaxis]
+
+        # La mejor posición global vive en el host; se lleva al backend del
+        # enjambre (sin copia con NumPy)
+        global_best_position = self.xp.asarray(global_best_position, dtype=self.dtype)
+
+        for start in range(0, self.size, self._tile_rows):
+            rows = slice(start, start + self._tile_rows)
+            self._update_rows(rows, global_best_position, w[rows] if per_particle_w else w,
+                              c1_r1[rows], c2_r2[rows])
+
+    def step_asynchronous(
+        self,
+        global_best_position: np.ndarray,
+        global_best_fitness: float,
+        w: Union[float, np.ndarray],
+        c1: float,
+        c2: float,
+        objective_function: Callable[[np.ndarray], float],
+    ) -> float:
+        """Actualiza y evalúa las partículas una a una (actualización asíncrona).
+
+        Cada partícula se mueve, se evalúa y actualiza su mejor posición 
+        personal antes de pasar a la siguiente; si mejora a la mejor global, 
+        las partículas posteriores de la misma generación ya se orientan hacia 
+        la nueva posición. Es la forma clásica del algoritmo.
+
+        Args:
+            global_best_position (np.ndarray): Mejor posición global (en el 
+                host); se actualiza en el sitio.
+            global_best_fitness (float): Aptitud de la mejor posición global.
+            w (Union[float, np.ndarray]): Factor de inercia, común o uno por 
+                partícula.
+            c1 (float): Coeficiente cognitivo (peso de la experiencia personal).
+            c2 (float): Coeficiente social (peso de la experiencia del enjambre).
+            objective_function (Callable[[np.ndarray], float]): Función que 
+                evalúa una posición.
+
+        Returns:
+            float: Aptitud de la mejor posición global tras la generación.
+        """
+        c1_r1, c2_r2 = self._random_factors(c1, c2)
+
+        # Un peso por partícula se aplica a toda su fila
+        per_particle_w = np.ndim(w) == 1
+        if per_particle_w:
+            w = self.xp.asarray(w)[:, np.newaxis]
+
+        # Con NumPy y float64 es el mismo array de la solución; en otro caso 
+        # se mantiene una copia en el backend del enjambre
+        global_best = self.xp.asarray(global_best_position, dtype=self.dtype)
+
+        for i in range(self.size):
+            rows = slice(i, i + 1)
+            self._update_rows(rows, global_best, w[rows] if per_particle_w else w,
+                              c1_r1[rows], c2_r2[rows])
+
+            position = self.to_host(self.positions[i])
+            fitness = float(objective_function(position))
+            self.fitness[i] = fitness
+
+            # Actualizar mejor posición personal
+            if fitness < self.best_fitness[i]:
+                self.best_fitness[i] = fitness
+                self.best_positions[i] = self.positions[i]
+
+            # Actualizar mejor posición global para las siguientes partículas
+            if fitness < global_best_fitness:
+                global_best_fitness = fitness
+                global_best[...] = self.positions[i]
+                if global_best is not global_best_position:
+                    global_best_position[...] = position
+
+        return global_best_fitness
+
+    def _random_factors(self, c1: float, c2: float):
+        """Devuelve los factores c1*r1 y c2*r2 de la generación actual.
+
+        Hay un único valor aleatorio por partícula para cada componente: la 
+        matriz (n_partículas, 2) de esta generación dentro del bloque 
+        pregenerado, que se rellena al agotarse. La secuencia es la misma que 
+        pidiendo una matriz por generación.
+
+        Args:
+            c1 (float): Coeficiente cognitivo.
+            c2 (float): Coeficiente social.
+
+        Returns:
+            Tuple: Columnas (n_partículas, 1) con c1*r1 y c2*r2.
+        """
+        if self._random_index == len(self._random_block):
+            self._random_block = self._rng.random(
+                (RANDOM_BLOCK_GENERATIONS, self.size, 2), dtype=self.dtype
+            )
+            self._random_index = 0
+        random_values = self._random_block[self._random_index]
+        self._random_index += 1
+
+        # Escalar el bloque en el sitio por (c1, c2): cada columna pasa a ser 
+        # el factor completo c*r de su componente, sin temporales por bloque
+        random_values[:, 0] *= c1
+        random_values[:, 1] *= c2
+        return random_values[:, 0:1], random_values[:, 1:2]
+
+    def _update_rows(self, rows: slice, global_best_position, w, c1_r1, c2_r2) -> None:
+        """Actualiza velocidad y posición de un bloque de filas en el sitio.
+
+        Args:
+            rows (slice): Filas (partículas) a actualizar.
+            global_best_position: Mejor posición global en el backend del 
+                enjambre.
+            w: Peso inercial común o columna de pesos de esas filas.
+            c1_r1: Columna con los factores cognitivos de esas filas.
+            c2_r2: Columna con los factores sociales de esas filas.
+        """
+        xp = self.xp
+        positions = self.positions[rows]
+        velocities = self.velocities[rows]
+        scratch = self._scratch[rows]
+
+        # Actualizar velocidad en el sitio: 
+        # w*v + c1*r1*(Pb - x) + c2*r2*(Gb - x)
+        velocities *= w
+        xp.subtract(self.best_positions[rows], positions, out=scratch)
+        scratch *= c1_r1
+        velocities += scratch
+        xp.subtract(global_best_position, positions, out=scratch)
+        scratch *= c2_r2
+        velocities += scratch
+
+        # Limitar velocidad
+        lower_vel, upper_vel = self._velocity_limits
+        xp.clip(velocities, lower_vel, upper_vel, out=velocities)
+
+        # Actualizar posición y aplicar el mecanismo de rebote en los límites
+        positions += velocities
+        apply_bounce(positions, velocities, self._position_limits, xp=xp)
+
+    def evaluate(
+        self,
+        objective_function: Callable[[np.ndarray], float],
+        map_function: Optional[Callable] = None,
+    ) -> np.ndarray:
+        """Evalúa todas las partículas y actualiza sus mejores posiciones.
+
+        La función objetivo siempre recibe posiciones en memoria del host. 
+        Si ofrece un método ``batch_evaluate`` (como las funciones benchmark) 
+        o tiene el atributo ``vectorized = True``, se evalúa una sola vez la 
+        matriz (n_partículas, dimensiones) completa, que debe producir el 
+        vector (n_partículas,) de aptitudes; en otro caso se invoca una vez 
+        por partícula, a través de map_function si se indica.
+
+        Args:
+            objective_function (Callable[[np.ndarray], float]): Función que 
+                evalúa una posición (o todas, si es vectorizada).
+            map_function (Optional[Callable], optional): Función con la firma 
+                de ``map`` (por ejemplo ``Pool.map``) para repartir la 
+                evaluación de las partículas. No se usa con funciones 
+                vectorizadas. Defaults to None.
+
+        Returns:
+            np.ndarray: Vector con la aptitud de cada partícula.
+        """
+        # Con NumPy se escribe directamente sobre el vector del enjambre
+        fitness = self.fitness if self.xp is np else np.empty(self.size)
+        host_positions = self.to_host(self.positions)
+        batch_evaluate = get_batch_evaluator(objective_function)
+
+        if batch_evaluate is not None:
+            fitness[...] = batch_evaluate(host_positions)
+        elif map_function is not None:
+            fitness[...] = map_function(objective_function, host_positions)
+        else:
+            for i, position in enumerate(host_positions):
+                fitness[i] = objective_function(position)
+
+        if fitness is not self.fitness:
+            self.fitness[...] = self.xp.asarray(fitness)
+            fitness = self.fitness
+
+        # Actualizar mejores posiciones personales de las partículas que 
+        # mejoran, con copias enmascaradas en el sitio (sin indexado booleano,
+        # que reúne las filas seleccionadas en temporales)
+        xp = self.xp
+        improved = fitness < self.best_fitness
+        xp.copyto(self.best_fitness, fitness, where=improved)
+        xp.copyto(self.best_positions, self.positions, where=improved[:, np.newaxis])
+
+        return fitness
+
+
+class ParticleView:
+    """Vista de una partícula sobre las matrices de un SwarmState.
+
+    Ofrece la interfaz por partícula (posición, velocidad, mejor posición y 
+    aptitudes) a las estrategias que recorren las partículas del estado del 
+    PSO. No copia datos: cada atributo lee la fila actual del enjambre.
+    """
+
+    __slots__ = ("_swarm", "index")
+
+    def __init__(self, swarm: SwarmState, index: int) -> None:
+        """Inicializa la vista.
+
+        Args:
+            swarm (SwarmState): Enjambre al que pertenece la partícula.
+            index (int): Fila de la partícula en las matrices del enjambre.
+        """
+        self._swarm = swarm
+        self.index = index
+
+    @property
+    def position(self) -> np.ndarray:
+        """np.ndarray: Posición actual (en memoria del host)."""
+        return self._swarm.to_host(self._swarm.positions[self.index])
+
+    @property
+    def velocity(self) -> np.ndarray:
+        """np.ndarray: Velocidad actual (en memoria del host)."""
+        return self._swarm.to_host(self._swarm.velocities[self.index])
+
+    @property
+    def best_position(self) -> np.ndarray:
+        """np.ndarray: Mejor posición personal (en memoria del host)."""
+        return self._swarm.to_host(self._swarm.best_positions[self.index])
+
+    @property
+    def fitness(self) -> float:
+        """float: Aptitud actual."""
+        return float(self._swarm.fitness[self.index])
+
+    @property
+    def best_fitness(self) -> float:
+        """float: Mejor aptitud personal."""
+        return float(self._swarm.best_fitness[self.index])
@@ -1,6 +1,7 @@
 """Módulo para registrar y obtener funciones benchmark."""
 
-from typing import Dict, Optional, Tuple, Type
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Tuple, Type
 
 from src.main.benchmarks.benchmark_strategy import BenchmarkStrategy
 
@@ -43,13 +44,14 @@ class BenchmarkRegistry:
         Raises:
             KeyError: Si la función benchmark no está registrada.
         """
-        if name not in cls._benchmark_functions:
+        benchmark_class = cls._benchmark_functions.get(name)
+        if benchmark_class is None:
             raise KeyError(
                 f"No se encontró una función benchmark con nombre '{name}'. "
                 f"Opciones disponibles: {list(cls._benchmark_functions.keys())}"
             )
         
-        return cls._benchmark_functions[name](dimensions=dimensions, bounds=bounds)
+        return benchmark_class(dimensions=dimensions, bounds=bounds)
     
     @classmethod
     def get_available_benchmarks(cls) -> Dict[str, str]:
@@ -76,13 +78,16 @@ class BenchmarkRegistry:
         return name in cls._benchmark_functions
     
     @classmethod
-    def get_all_benchmarks(cls) -> Dict[str, Type[BenchmarkStrategy]]:
+    def get_all_benchmarks(cls) -> Mapping[str, Type[BenchmarkStrategy]]:
         """Devuelve todas las funciones benchmark registradas.
         
+        La vista es de solo lectura y refleja el registro actual; para
+        registrar funciones se debe usar ``register``.
+        
         Returns:
-            Dict[str, Type[BenchmarkStrategy]]: Diccionario con todas las funciones
+            Mapping[str, Type[BenchmarkStrategy]]: Vista con todas las funciones
         """
-        return cls._benchmark_functions.copy()
+        return MappingProxyType(cls._benchmark_functions)
     
     @classmethod
     def clear_registrations(cls) -> None:
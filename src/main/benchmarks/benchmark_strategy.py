@@ -57,8 +57,9 @@ class BenchmarkStrategy(ABC):
         Returns:
             float: Resultado de la evaluación.
         """
-        # Verificar dimensiones
-        if len(x) != self.dimensions:
+        # Verificar dimensiones (se omite con python -O; PSO ya construye
+        # las posiciones con la forma correcta)
+        if __debug__ and len(x) != self.dimensions:
             raise ValueError(
                 f"La dimensión del vector de entrada ({len(x)}) no coincide "
                 f"con la dimensión de la función ({self.dimensions})"
@@ -66,6 +67,43 @@ class BenchmarkStrategy(ABC):
 
         return self._evaluate(x)
 
+    def batch_evaluate(self, X: np.ndarray) -> np.ndarray:
+        """Evalúa varias posiciones a la vez.
+
+        Recibe la matriz (n_puntos, dimensiones) y devuelve el valor de cada 
+        fila. Por defecto evalúa las filas una a una con _evaluate; las 
+        funciones concretas lo sobrescriben con una expresión vectorizada.
+
+        Args:
+            X (np.ndarray): Matriz (n_puntos, dimensiones) de posiciones.
+
+        Returns:
+            np.ndarray: Vector (n_puntos,) con el valor de la función en cada 
+                posición.
+
+        Raises:
+            ValueError: Si el número de columnas no coincide con la dimensión.
+        """
+        # Verificar dimensiones (una sola vez para todo el lote)
+        if X.shape[1] != self.dimensions:
+            raise ValueError(
+                f"La dimensión de las posiciones de entrada ({X.shape[1]}) no "
+                f"coincide con la dimensión de la función ({self.dimensions})"
+            )
+
+        return self._batch_evaluate(X)
+
+    def _batch_evaluate(self, X: np.ndarray) -> np.ndarray:
+        """Implementación de la evaluación por lotes, sin comprobaciones.
+
+        Args:
+            X (np.ndarray): Matriz (n_puntos, dimensiones) de posiciones.
+
+        Returns:
+            np.ndarray: Vector (n_puntos,) con el valor de cada posición.
+        """
+        return np.fromiter((self._evaluate(x) for x in X), dtype=float, count=len(X))
+
     def get_info(self) -> Dict[str, Any]:
         """Devuelve información sobre la función benchmark.
 
@@ -90,7 +128,23 @@ class BenchmarkStrategy(ABC):
             bool: True si está dentro de los límites, False en caso contrario.
         """
         lower_bound, upper_bound = self.bounds
-        return np.all(x >= lower_bound) and np.all(x <= upper_bound)
+        # El segundo recorrido solo se hace si el primero no encuentra fallos
+        return bool((x >= lower_bound).all() and (x <= upper_bound).all())
+
+    def are_within_bounds(self, X: np.ndarray) -> np.ndarray:
+        """Comprueba qué posiciones de una matriz están dentro de los límites.
+
+        Args:
+            X (np.ndarray): Matriz (n_puntos, dimensiones) de posiciones.
+
+        Returns:
+            np.ndarray: Vector booleano (n_puntos,), True para cada fila con 
+                todas sus coordenadas dentro de los límites.
+        """
+        lower_bound, upper_bound = self.bounds
+        inside = X >= lower_bound
+        inside &= X <= upper_bound
+        return inside.all(axis=1)
 
     def __str__(self) -> str:
         """Representación en cadena de la función benchmark.
@@ -20,6 +20,11 @@ class Griewank(BenchmarkStrategy):
             dimensions (int): Número de dimensiones para la función.
             bounds (Optional[Tuple[float, float]]): Tupla (min, max) con límites.
         """
+        # Inversos 1 / sqrt(i + 1) del término producto, para multiplicar en 
+        # lugar de dividir (se usan ya al calcular el óptimo en el constructor 
+        # base)
+        self._inv_sqrt_idx = 1.0 / np.sqrt(np.arange(1, dimensions + 1))
+
         super().__init__(
             dimensions, 
             bounds if bounds is not None else (-100.0, 100.0)
@@ -37,10 +42,21 @@ class Griewank(BenchmarkStrategy):
         sum_part = np.sum(x**2) / 4000.0
 
         # Calcular el producto de los cosenos
-        prod_part = 1.0
-        for i in range(len(x)):
-            prod_part *= np.cos(x[i] / np.sqrt(i + 1))
+        prod_part = np.prod(np.cos(x * self._inv_sqrt_idx))
+
+        return 1.0 + sum_part - prod_part
+
+    def _batch_evaluate(self, X: np.ndarray) -> np.ndarray:
+        """Evalúa la función Griewank en cada fila de X.
 
+        Args:
+            X (np.ndarray): Matriz (n_puntos, dimensiones) de posiciones.
+
+        Returns:
+            np.ndarray: Vector (n_puntos,) con el valor de cada posición.
+        """
+        sum_part = np.sum(X**2, axis=1) / 4000.0
+        prod_part = np.prod(np.cos(X * self._inv_sqrt_idx), axis=1)
         return 1.0 + sum_part - prod_part
 
     def _get_global_optimum(self) -> np.ndarray:
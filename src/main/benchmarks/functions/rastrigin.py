@@ -7,6 +7,8 @@ import numpy as np
 from src.main.benchmarks.benchmark_registry import BenchmarkRegistry
 from src.main.benchmarks.benchmark_strategy import BenchmarkStrategy
 
+TWO_PI = 2 * np.pi
+
 
 @BenchmarkRegistry.register("rastrigin")
 class Rastrigin(BenchmarkStrategy):
@@ -36,8 +38,40 @@ class Rastrigin(BenchmarkStrategy):
             float: Valor de la función en la posición dada.
         """
         d = len(x)
-        sum_term = np.sum(x**2 - 10 * np.cos(2 * np.pi * x))
-        return 10 * d + sum_term
+        return 10 * d + np.sum(self._terms(x))
+
+    def _batch_evaluate(self, X: np.ndarray) -> np.ndarray:
+        """Evalúa la función Rastrigin en cada fila de X.
+
+        Args:
+            X (np.ndarray): Matriz (n_puntos, dimensiones) de posiciones.
+
+        Returns:
+            np.ndarray: Vector (n_puntos,) con el valor de cada posición.
+        """
+        d = X.shape[1]
+        return 10 * d + np.sum(self._terms(X), axis=1)
+
+    @staticmethod
+    def _terms(x: np.ndarray) -> np.ndarray:
+        """Calcula x**2 - 10*cos(2*pi*x) elemento a elemento.
+
+        Usa solo dos arrays temporales, operando sobre ellos en el sitio. No 
+        se reutiliza un buffer de la instancia para que la evaluación siga 
+        siendo segura entre hilos.
+
+        Args:
+            x (np.ndarray): Posición o matriz de posiciones.
+
+        Returns:
+            np.ndarray: Array de la misma forma que x con cada término.
+        """
+        cos_term = np.multiply(x, TWO_PI)
+        np.cos(cos_term, out=cos_term)
+        cos_term *= 10
+        terms = np.square(x)
+        terms -= cos_term
+        return terms
 
     def _get_global_optimum(self) -> np.ndarray:
         """Devuelve la posición del óptimo global para la función Rastrigin.
@@ -35,10 +35,20 @@ class Rosenbrock(BenchmarkStrategy):
         Returns:
             float: Valor de la función en la posición dada.
         """
-        sum_value = 0.0
-        for i in range(len(x) - 1):
-            sum_value += 100 * (x[i + 1] - x[i] ** 2) ** 2 + (x[i] - 1) ** 2
-        return sum_value
+        head, tail = x[:-1], x[1:]
+        return np.sum(100 * (tail - head ** 2) ** 2 + (head - 1) ** 2)
+
+    def _batch_evaluate(self, X: np.ndarray) -> np.ndarray:
+        """Evalúa la función Rosenbrock en cada fila de X.
+
+        Args:
+            X (np.ndarray): Matriz (n_puntos, dimensiones) de posiciones.
+
+        Returns:
+            np.ndarray: Vector (n_puntos,) con el valor de cada posición.
+        """
+        head, tail = X[:, :-1], X[:, 1:]
+        return np.sum(100 * (tail - head ** 2) ** 2 + (head - 1) ** 2, axis=1)
 
     def _get_global_optimum(self) -> np.ndarray:
         """Devuelve la posición del óptimo global para la función Rosenbrock.
@@ -32,7 +32,20 @@ class Sphere(BenchmarkStrategy):
         Returns:
             float: Valor de la función en la posición dada.
         """
-        return np.sum(x**2)
+        # Producto escalar x·x: una sola pasada, sin el array temporal x**2
+        return float(np.dot(x, x))
+
+    def _batch_evaluate(self, X: np.ndarray) -> np.ndarray:
+        """Evalúa la función Sphere en cada fila de X.
+
+        Args:
+            X (np.ndarray): Matriz (n_puntos, dimensiones) de posiciones.
+
+        Returns:
+            np.ndarray: Vector (n_puntos,) con el valor de cada posición.
+        """
+        # Producto escalar de cada fila consigo misma, sin el temporal X**2
+        return np.einsum("ij,ij->i", X, X)
 
     def _get_global_optimum(self) -> np.ndarray:
         """Devuelve la posición del óptimo global para la función Sphere.
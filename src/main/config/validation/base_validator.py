@@ -1,21 +1,29 @@
 """Clase base para el sistema de validación."""
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Set
+from typing import Any, ClassVar, Dict, Optional, Set
 
 from src.main.config.validation.context import ValidationContext
 
 
 class BaseValidator(ABC):
-    """Clase base para validadores."""
+    """Clase base para validadores.
     
-    def __init__(self, name: str) -> None:
+    Cada subclase declara su nombre en el atributo de clase ``name``, de modo 
+    que el registro puede leerlo sin crear instancias.
+    """
+    
+    name: ClassVar[str]
+    
+    def __init__(self, name: Optional[str] = None) -> None:
         """Inicializa el validador.
         
         Args:
-            name: Nombre del validador para identificación.
+            name: Nombre del validador para identificación. Por defecto, el 
+                atributo de clase ``name``.
         """
-        self.name = name
+        if name is not None:
+            self.name = name
         self._dependencies: Set[str] = set()
     
     @property
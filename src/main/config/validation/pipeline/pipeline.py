@@ -3,8 +3,7 @@
 Maneja el orden de ejecución basado en dependencias sin archivos auxiliares.
 """
 
-from typing import Dict, Any, List
-from collections import defaultdict, deque
+from typing import Dict, Any, List, Tuple
 import logging
 
 from src.main.config.validation.base_validator import BaseValidator
@@ -13,6 +12,90 @@ from src.main.config.validation.pipeline.registry import get_registered_validato
 
 logger = logging.getLogger(__name__)
 
+# Firma de un conjunto de validadores: pares (nombre, dependencias) en orden 
+# de registro
+ValidatorSignature = Tuple[Tuple[str, Tuple[str, ...]], ...]
+
+# Órdenes de ejecución ya resueltos, por firma. El conjunto de validadores 
+# registrados no cambia durante el proceso, así que cada pipeline creado 
+# reutiliza el orden calculado por el primero
+_ORDER_CACHE: Dict[ValidatorSignature, Tuple[str, ...]] = {}
+
+
+def compute_order(signature: ValidatorSignature) -> Tuple[str, ...]:
+    """Devuelve el orden de ejecución de un conjunto de validadores.
+
+    El resultado se guarda en caché por firma, de modo que el ordenamiento 
+    topológico solo se calcula una vez por conjunto de validadores.
+
+    Args:
+        signature: Pares (nombre, dependencias) de los validadores
+
+    Returns:
+        Nombres de los validadores en orden de ejecución
+
+    Raises:
+        ValueError: Si falta una dependencia o hay dependencias circulares
+    """
+    order = _ORDER_CACHE.get(signature)
+    if order is None:
+        order = _ORDER_CACHE[signature] = _topological_order(dict(signature))
+        logger.info(f"Resolved execution order: {' -> '.join(order)}")
+    return order
+
+
+def _topological_order(dependencies: Dict[str, Tuple[str, ...]]) -> Tuple[str, ...]:
+    """Calcula el orden de ejecución con un recorrido en profundidad.
+
+    El recorrido es iterativo (con una pila explícita) y emite cada validador 
+    en post-orden, es decir, después de todas sus dependencias. Cada nodo se 
+    marca como pendiente (0), en curso (1) o terminado (2); encontrar un nodo 
+    en curso indica una dependencia circular.
+
+    Args:
+        dependencies: Dependencias de cada validador, por nombre
+
+    Returns:
+        Nombres de los validadores en orden de ejecución
+
+    Raises:
+        ValueError: Si falta una dependencia o hay dependencias circulares
+    """
+    state = dict.fromkeys(dependencies, 0)
+    execution_order = []
+    
+    for root in dependencies:
+        if state[root]:
+            continue
+        state[root] = 1
+        stack = [(root, iter(dependencies[root]))]
+        
+        while stack:
+            current, pending = stack[-1]
+            for dep in pending:
+                dep_state = state.get(dep)
+                if dep_state is None:
+                    raise ValueError(
+                        f"Validator '{current}' depends on '{dep}' which doesn't exist"
+                    )
+                if dep_state == 1:
+                    remaining = {name for name, _ in stack}
+                    raise ValueError(
+                        f"Circular dependencies detected among validators: {remaining}"
+                    )
+                if dep_state == 0:
+                    # Visitar la dependencia antes de seguir con este nodo
+                    state[dep] = 1
+                    stack.append((dep, iter(dependencies[dep])))
+                    break
+            else:
+                # Todas las dependencias emitidas: emitir el nodo
+                stack.pop()
+                state[current] = 2
+                execution_order.append(current)
+    
+    return tuple(execution_order)
+
 
 class ValidationPipeline:
     """Pipeline de validación que maneja dependencias entre validadores.
@@ -24,6 +107,7 @@ class ValidationPipeline:
         """Inicializa el pipeline vacío."""
         self._validators: Dict[str, BaseValidator] = {}
         self._execution_order: List[str] = []
+        self._ordered_validators: Tuple[BaseValidator, ...] = ()
         self._dependencies_resolved = False
     
     def add_validator(self, validator: BaseValidator) -> None:
@@ -35,56 +119,24 @@ class ValidationPipeline:
         if validator.name in self._validators:
             raise ValueError(f"Validator '{validator.name}' already exists in pipeline")
         self._validators[validator.name] = validator
+        self._dependencies_resolved = False
     
     def _resolve_dependencies(self) -> None:
         """Resuelve dependencias y calcula orden de ejecución.
         
-        Utiliza ordenamiento topológico (algoritmo de Kahn).
+        Utiliza ordenamiento topológico (recorrido en profundidad), reutilizando el 
+        orden en caché si ya se resolvió para el mismo conjunto de validadores.
         """
-        # Verificar que todas las dependencias existen
-        for validator_name, validator in self._validators.items():
-            for dep in validator.dependencies:
-                if dep not in self._validators:
-                    raise ValueError(
-                        f"Validator '{validator_name}' depends on '{dep}' which doesn't exist"
-                    )
-        
-        # Algoritmo de Kahn para ordenamiento topológico
-        in_degree = defaultdict(int)
-        graph = defaultdict(list)
-        
-        # Construir grafo y calcular grados de entrada
-        for validator_name in self._validators:
-            in_degree[validator_name] = 0
-        
-        for validator_name, validator in self._validators.items():
-            for dep in validator.dependencies:
-                graph[dep].append(validator_name)
-                in_degree[validator_name] += 1
-        
-        # Encontrar nodos sin dependencias
-        queue = deque([name for name in self._validators if in_degree[name] == 0])
-        execution_order = []
-        
-        while queue:
-            current = queue.popleft()
-            execution_order.append(current)
-            
-            # Reducir grado de entrada de vecinos
-            for neighbor in graph[current]:
-                in_degree[neighbor] -= 1
-                if in_degree[neighbor] == 0:
-                    queue.append(neighbor)
-        
-        # Verificar dependencias circulares
-        if len(execution_order) != len(self._validators):
-            remaining = set(self._validators.keys()) - set(execution_order)
-            raise ValueError(f"Circular dependencies detected among validators: {remaining}")
-        
-        self._execution_order = execution_order
+        signature = tuple(
+            (validator_name, tuple(sorted(validator.dependencies)))
+            for validator_name, validator in self._validators.items()
+        )
+        self._execution_order = list(compute_order(signature))
+        # Instancias en orden de ejecución, para recorrerlas sin buscar por nombre
+        self._ordered_validators = tuple(
+            self._validators[name] for name in self._execution_order
+        )
         self._dependencies_resolved = True
-        
-        logger.info(f"Resolved execution order: {' -> '.join(execution_order)}")    
     
     def validate(self, config: Dict[str, Any]) -> Dict[str, Any]:
         """Ejecuta validación completa de la configuración.
@@ -106,13 +158,11 @@ class ValidationPipeline:
         # Crear contexto de validación
         context = ValidationContext()
                 
-        for validator_name in self._execution_order:
-            validator = self._validators[validator_name]
-            
+        for validator in self._ordered_validators:
             try:
                 validator.validate(config, context)                
             except Exception as e:
-                raise ValueError(f"Validation failed at '{validator_name}': {e}") from e
+                raise ValueError(f"Validation failed at '{validator.name}': {e}") from e
         
         # Retornar configuración validada
         validated_config = context.get_validated_config()
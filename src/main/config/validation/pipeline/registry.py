@@ -1,12 +1,16 @@
 """Registro de validadores con decorador para auto-registro."""
 
-from typing import List, Type, Dict
+from types import MappingProxyType
+from typing import List, Type, Dict, Mapping
 from functools import wraps
 
 from src.main.config.validation.base_validator import BaseValidator
 
 _REGISTERED_VALIDATORS: Dict[str, Type[BaseValidator]] = {}
 
+# Vista de solo lectura del registro, creada una sola vez
+_REGISTERED_VIEW: Mapping[str, Type[BaseValidator]] = MappingProxyType(_REGISTERED_VALIDATORS)
+
 
 def validator(dependencies: List[str] = None):
     """Decorador para auto-registrar validadores con dependencias opcionales.
@@ -18,23 +22,39 @@ def validator(dependencies: List[str] = None):
         Decorador que registra la clase
     """
     def decorator(cls: Type[BaseValidator]):
-        temp_instance = cls()
-        _REGISTERED_VALIDATORS[temp_instance.name] = cls
+        # El nombre se lee del atributo de clase, sin instanciar el validador
+        name = getattr(cls, "name", None)
+        if not isinstance(name, str):
+            raise ValueError(
+                f"Validator class '{cls.__name__}' must define a 'name' class attribute"
+            )
+        _REGISTERED_VALIDATORS[name] = cls
 
         if dependencies:
             original_init = cls.__init__
+            # Congelar las dependencias al decorar: cada instancia las agrega 
+            # con una sola llamada
+            dependency_names = tuple(dependencies)
             
             @wraps(original_init)
             def enhanced_init(self, *args, **kwargs):
                 original_init(self, *args, **kwargs)
-                for dep in dependencies:
-                    self.depends_on(dep)
+                self.depends_on(*dependency_names)
             cls.__init__ = enhanced_init
 
         return cls
     return decorator
 
 
-def get_registered_validators() -> Dict[str, Type[BaseValidator]]:
+def get_registered_validators() -> Mapping[str, Type[BaseValidator]]:
+    """Retorna una vista de solo lectura de los validadores registrados.
+
+    La vista refleja registros posteriores; para obtener una copia 
+    independiente se usa snapshot_registered_validators.
+    """
+    return _REGISTERED_VIEW
+
+
+def snapshot_registered_validators() -> Dict[str, Type[BaseValidator]]:
     """Retorna copia de todos los validadores registrados."""
     return _REGISTERED_VALIDATORS.copy()
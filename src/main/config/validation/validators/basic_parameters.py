@@ -1,24 +1,62 @@
 """Validador de parámetros básicos del algoritmo PSO."""
 
-from typing import Any, Dict, List
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
-from src.main.benchmarks.benchmark_factory import get_benchmark_function
 from src.main.config.validation.base_validator import BaseValidator
 from src.main.config.validation.context import ValidationContext
 from src.main.config.validation.pipeline.registry import validator
 
+# Plantillas de los mensajes de error (se formatean solo al lanzar el error)
+_ERR_REQUIRED = "Parameter '{name}' is required"
+_ERR_POSITIVE_INT = "'{name}' must be a positive integer, got: {value}"
+_ERR_CHOICE = "'{name}' must be one of {options}, got: {value}"
+_ERR_NOT_STRING = "'{name}' must be a string, got: {value_type}"
+_ERR_BENCHMARK = "Invalid benchmark function '{name}': {error}"
+_ERR_BOUNDS_FORMAT = "'{name}' must be a list of 2 numeric elements [min, max], got: {value!r}"
+_ERR_BOUNDS_ORDER = (
+    "'{name}' min value must be less than max value, got: min={min_val}, max={max_val}"
+)
+
+
+@lru_cache(maxsize=64)
+def _cached_benchmark(name: str, dimensions: int, 
+                      bounds_key: Optional[Tuple[float, float]]):
+    """Crea la función benchmark, reutilizando instancias ya creadas.
+
+    Validar varias veces la misma configuración (barridos de parámetros) 
+    devuelve la misma instancia; al superar maxsize se descartan las menos 
+    usadas recientemente. Las funciones benchmark no guardan estado entre 
+    evaluaciones, así que compartirlas es seguro.
+
+    Args:
+        name: Nombre de la función benchmark.
+        dimensions: Número de dimensiones.
+        bounds_key: Tupla (min, max) con los límites, o None para los 
+            límites por defecto.
+
+    Returns:
+        BenchmarkStrategy: Instancia de la función benchmark.
+    """
+    # Importación diferida: carga NumPy y las funciones benchmark
+    from src.main.benchmarks.benchmark_factory import get_benchmark_function
+
+    bounds = list(bounds_key) if bounds_key is not None else None
+    return get_benchmark_function(name, dimensions, bounds)
+
 
 @validator()
 class BasicParametersValidador(BaseValidator):
     """Validador para parámetros básicos del algoritmo PSO.
     
-    Valida: dimensions, population_size, generations, runs, benchmark,
-    bounds, velocity_bounds, benchmark_function.
+    Valida: dimensions, population_size, generations, runs, workers, 
+    backend, dtype, update_mode, benchmark, bounds, velocity_bounds, benchmark_function.
     """
     
-    def __init__(self) -> None:
-        """Inicializa el validador de parámetros básicos."""
-        super().__init__("basic_parameters")
+    # Parámetros obligatorios que deben ser enteros positivos
+    _POSITIVE_INT_FIELDS = ('dimensions', 'population_size', 'generations', 'runs')
+    
+    name = "basic_parameters"
     
     def validate(self, config: Dict[str, Any], 
                  context: ValidationContext) -> None:
@@ -31,56 +69,62 @@ class BasicParametersValidador(BaseValidator):
         Raises:
             ValueError: Si algún parámetro es inválido.
         """
-        # Validar dimensions
-        dimensions = config.get('dimensions')
-        if dimensions is None:
-            raise ValueError("Parameter 'dimensions' is required")
-        if not isinstance(dimensions, int) or dimensions <= 0:
-            raise ValueError(
-                f"'dimensions' must be a positive integer, got: {dimensions}"
-            )
-        context.dimensions = dimensions
+        # Importación diferida: el módulo del enjambre carga NumPy
+        from src.main.algorithm.swarm import (
+            ARRAY_BACKENDS, STATE_DTYPES, UPDATE_MODES, get_array_module
+        )
         
-        # Validar population_size
-        population_size = config.get('population_size')
-        if population_size is None:
-            raise ValueError("Parameter 'population_size' is required")
-        if not isinstance(population_size, int) or population_size <= 0:
-            raise ValueError(
-                f"'population_size' must be a positive integer, "
-                f"got: {population_size}"
-            )
-        context.population_size = population_size
+        # Validar dimensions, population_size, generations y runs 
+        # (type() en lugar de isinstance para rechazar también los bool)
+        for field in self._POSITIVE_INT_FIELDS:
+            value = config.get(field)
+            if value is None:
+                raise ValueError(_ERR_REQUIRED.format(name=field))
+            if type(value) is not int or value <= 0:
+                raise ValueError(_ERR_POSITIVE_INT.format(name=field, value=value))
+            setattr(context, field, value)
+        dimensions = context.dimensions
         
-        # Validar generations
-        generations = config.get('generations')
-        if generations is None:
-            raise ValueError("Parameter 'generations' is required")
-        if not isinstance(generations, int) or generations <= 0:
-            raise ValueError(
-                f"'generations' must be a positive integer, "
-                f"got: {generations}"
-            )
-        context.generations = generations
+        # Validar workers (opcional)
+        workers = config.get('workers', 1)
+        if type(workers) is not int or workers <= 0:
+            raise ValueError(_ERR_POSITIVE_INT.format(name='workers', value=workers))
+        context.workers = workers
         
-        # Validar runs
-        runs = config.get('runs')
-        if runs is None:
-            raise ValueError("Parameter 'runs' is required")
-        if not isinstance(runs, int) or runs <= 0:
-            raise ValueError(
-                f"'runs' must be a positive integer, got: {runs}"
-            )
-        context.runs = runs
+        # Validar backend de arrays (opcional)
+        backend = config.get('backend', 'numpy')
+        if backend not in ARRAY_BACKENDS:
+            raise ValueError(_ERR_CHOICE.format(
+                name='backend', options=ARRAY_BACKENDS, value=backend
+            ))
+        # Comprobar que el backend está disponible (CuPy es opcional)
+        get_array_module(backend)
+        context.backend = backend
+        
+        # Validar tipo de dato del estado del enjambre (opcional)
+        dtype = config.get('dtype', 'float64')
+        if dtype not in STATE_DTYPES:
+            raise ValueError(_ERR_CHOICE.format(
+                name='dtype', options=STATE_DTYPES, value=dtype
+            ))
+        context.dtype = dtype
+        
+        # Validar modo de actualización del enjambre (opcional)
+        update_mode = config.get('update_mode', 'asynchronous')
+        if update_mode not in UPDATE_MODES:
+            raise ValueError(_ERR_CHOICE.format(
+                name='update_mode', options=UPDATE_MODES, value=update_mode
+            ))
+        context.update_mode = update_mode
         
         # Validar benchmark
         benchmark = config.get('benchmark')
         if benchmark is None:
-            raise ValueError("Parameter 'benchmark' is required")
+            raise ValueError(_ERR_REQUIRED.format(name='benchmark'))
         if not isinstance(benchmark, str):
-            raise ValueError(
-                f"'benchmark' must be a string, got: {type(benchmark)}"
-            )
+            raise ValueError(_ERR_NOT_STRING.format(
+                name='benchmark', value_type=type(benchmark)
+            ))
         
         # Validar bounds
         bounds_config = config.get('bounds')
@@ -93,8 +137,8 @@ class BasicParametersValidador(BaseValidator):
             
         # Generar función de benchmark
         try:
-            benchmark_function = get_benchmark_function(
-                benchmark, dimensions, bounds
+            benchmark_function = _cached_benchmark(
+                benchmark, dimensions, tuple(bounds) if bounds is not None else None
             )
             context.benchmark = benchmark
             context.benchmark_function = benchmark_function
@@ -108,9 +152,7 @@ class BasicParametersValidador(BaseValidator):
             
             context.bounds = bounds
         except Exception as e:
-            raise ValueError(
-                f"Invalid benchmark function '{benchmark}': {e}"
-            ) from e
+            raise ValueError(_ERR_BENCHMARK.format(name=benchmark, error=e)) from e
         
         # Validar velocity_bounds (opcional)
         velocity_bounds = config.get('velocity_bounds')        
@@ -131,31 +173,24 @@ class BasicParametersValidador(BaseValidator):
         """Valida los bounds que se aplican a todas las dimensiones."""
         if bounds is None:
             if required:
-                raise ValueError(f"Parameter '{param_name}' is required")
+                raise ValueError(_ERR_REQUIRED.format(name=param_name))
             return None
         
-        if not isinstance(bounds, list):
-            raise ValueError(
-                f"'{param_name}' must be a list, got: {type(bounds)}"
-            )
-        
-        if len(bounds) != 2:
-            raise ValueError(
-                f"'{param_name}' must have exactly 2 elements [min, max], "
-                f"got: {len(bounds)}"
-            )
-        
+        # Desempaquetar y convertir en un solo paso; el desempaquetado falla 
+        # si no hay exactamente 2 elementos
         try:
-            min_val, max_val = float(bounds[0]), float(bounds[1])
+            if not isinstance(bounds, (list, tuple)):
+                raise TypeError(type(bounds))
+            lower, upper = bounds
+            min_val, max_val = float(lower), float(upper)
         except (ValueError, TypeError) as e:
             raise ValueError(
-                f"'{param_name}' elements must be numeric, got: {bounds}"
+                _ERR_BOUNDS_FORMAT.format(name=param_name, value=bounds)
             ) from e
         
         if min_val >= max_val:
-            raise ValueError(
-                f"'{param_name}' min value must be less than max value, "
-                f"got: min={min_val}, max={max_val}"
-            )
+            raise ValueError(_ERR_BOUNDS_ORDER.format(
+                name=param_name, min_val=min_val, max_val=max_val
+            ))
         
         return [min_val, max_val]
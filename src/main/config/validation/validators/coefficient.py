@@ -1,13 +1,95 @@
 """Validador de coeficientes de aceleración con dependencia de parámetros básicos."""
 
+from functools import lru_cache
 from typing import Dict, Any, Union, List, Tuple
 
 from src.main.config.validation.pipeline.registry import validator
 from src.main.config.validation.base_validator import BaseValidator
 from src.main.config.validation.context import ValidationContext
-from src.main.algorithm.coefficient.coefficient_factory import (
-    get_coefficient_strategy
-)
+
+# Plantillas de los mensajes de error (se formatean solo al lanzar el error)
+_ERR_DEPENDENCY = "Coefficient validator requires basic_parameters to be validated first"
+_ERR_REQUIRED = "Parameter '{name}' is required"
+_ERR_STRATEGY = "Failed to create {name} strategy: {error}"
+_ERR_NEGATIVE = "'{name}' must be non-negative, got: {value}"
+_ERR_LIST_LENGTH = "'{name}' list must have at least 2 elements [min, max], got: {length}"
+_ERR_NOT_NUMERIC = "'{name}' min and max values must be numeric, got: {values}"
+_ERR_NEGATIVE_BOUND = "'{name}' {bound} value must be non-negative, got: {value}"
+_ERR_ORDER = "'{name}' min value must be <= max value, got: {min_val} > {max_val}"
+_ERR_NOT_STRING = "'{name}' strategy must be a string, got: {value_type}"
+_ERR_FORMAT = "'{name}' must be a number or list [min, max, strategy], got: {value_type}"
+
+
+@lru_cache(maxsize=128)
+def _parse_coefficient(coeff_value: Any, coeff_type: str) -> Union[float, List]:
+    """Valida el formato de un coeficiente, con caché por valor.
+
+    Una misma configuración validada varias veces (por ejemplo, en un barrido 
+    de parámetros) no repite las conversiones ni las comprobaciones. El valor 
+    debe ser hashable (las listas se pasan como tuplas); los errores no se 
+    guardan en caché.
+
+    Args:
+        coeff_value: Valor del coeficiente a validar
+        coeff_type: Tipo de coeficiente para mensajes de error
+
+    Returns:
+        Valor validado en formato apropiado (la lista devuelta es compartida 
+        entre llamadas y no debe modificarse)
+
+    Raises:
+        ValueError: Si el formato es inválido
+    """
+    # Caso 1: Valor constante
+    if isinstance(coeff_value, (int, float)):
+        value = float(coeff_value)
+        if value < 0:
+            raise ValueError(_ERR_NEGATIVE.format(name=coeff_type, value=value))
+        return value
+    
+    # Caso 2: Lista/tupla con estrategia dinámica
+    if isinstance(coeff_value, (list, tuple)):
+        if len(coeff_value) < 2:
+            raise ValueError(_ERR_LIST_LENGTH.format(
+                name=coeff_type, length=len(coeff_value)
+            ))
+        
+        # Validar valores mínimo y máximo
+        try:
+            min_val = float(coeff_value[0])
+            max_val = float(coeff_value[1])
+        except (ValueError, TypeError) as e:
+            raise ValueError(_ERR_NOT_NUMERIC.format(
+                name=coeff_type, values=list(coeff_value[:2])
+            )) from e
+        
+        if min_val < 0:
+            raise ValueError(_ERR_NEGATIVE_BOUND.format(
+                name=coeff_type, bound="min", value=min_val
+            ))
+        if max_val < 0:
+            raise ValueError(_ERR_NEGATIVE_BOUND.format(
+                name=coeff_type, bound="max", value=max_val
+            ))
+        if min_val > max_val:
+            raise ValueError(_ERR_ORDER.format(
+                name=coeff_type, min_val=min_val, max_val=max_val
+            ))
+        
+        # Validar estrategia (opcional, por defecto "linear_decreasing")
+        strategy = "linear_decreasing"  # Valor por defecto
+        if len(coeff_value) > 2:
+            if not isinstance(coeff_value[2], str):
+                raise ValueError(_ERR_NOT_STRING.format(
+                    name=coeff_type, value_type=type(coeff_value[2])
+                ))
+        
+        return [min_val, max_val, strategy]
+    
+    # Caso 3: Formato no soportado
+    raise ValueError(_ERR_FORMAT.format(
+        name=coeff_type, value_type=type(coeff_value)
+    ))
 
 
 @validator(dependencies=["basic_parameters"])
@@ -21,18 +103,14 @@ class CoefficientValidador(BaseValidator):
     Depende de: basic_parameters
     """
     
-    def __init__(self):
-        super().__init__("coefficient")
+    name = "coefficient"
     
     def validate(self, config: Dict[str, Any], 
                  context: ValidationContext) -> None:
         """Valida las estrategias de coeficientes y sus parámetros."""
         # Verificar que las dependencias están satisfechas
         if context.generations is None:
-            raise ValueError(
-                "Coefficient validator requires basic_parameters to be "
-                "validated first"
-            )
+            raise ValueError(_ERR_DEPENDENCY)
         
         # Validar coeficiente c1
         self._validate_coefficient(config, context, "c1")
@@ -56,20 +134,22 @@ class CoefficientValidador(BaseValidator):
         """
         coeff_value = config.get(coeff_type)
         if coeff_value is None:
-            raise ValueError(f"Parameter '{coeff_type}' is required")
+            raise ValueError(_ERR_REQUIRED.format(name=coeff_type))
         
         # Validar formato del coeficiente
         validated_config_coefficient = self._validate_coefficient_format(
             coeff_value, coeff_type
         )
         
-        # Crear estrategia usando el factory
+        # Crear estrategia usando el factory (importación diferida: carga 
+        # NumPy y las estrategias)
+        from src.main.algorithm.coefficient.coefficient_factory import (
+            get_coefficient_strategy
+        )
         try:
             strategy = get_coefficient_strategy(validated_config_coefficient)
         except Exception as e:
-            raise ValueError(
-                f"Failed to create {coeff_type} strategy: {e}"
-            ) from e
+            raise ValueError(_ERR_STRATEGY.format(name=coeff_type, error=e)) from e
         
         # Establecer en contexto
         if coeff_type == "c1":
@@ -94,62 +174,13 @@ class CoefficientValidador(BaseValidator):
         Raises:
             ValueError: Si el formato es inválido
         """
-        # Caso 1: Valor constante
-        if isinstance(coeff_value, (int, float)):
-            value = float(coeff_value)
-            if value < 0:
-                raise ValueError(
-                    f"'{coeff_type}' must be non-negative, got: {value}"
-                )
-            return value
-        
-        # Caso 2: Lista/tupla con estrategia dinámica
-        if isinstance(coeff_value, (list, tuple)):
-            if len(coeff_value) < 2:
-                raise ValueError(
-                    f"'{coeff_type}' list must have at least 2 elements "
-                    f"[min, max], got: {len(coeff_value)}"
-                )
-            
-            # Validar valores mínimo y máximo
-            try:
-                min_val = float(coeff_value[0])
-                max_val = float(coeff_value[1])
-            except (ValueError, TypeError) as e:
-                raise ValueError(
-                    f"'{coeff_type}' min and max values must be numeric, "
-                    f"got: {coeff_value[:2]}"
-                ) from e
-            
-            if min_val < 0:
-                raise ValueError(
-                    f"'{coeff_type}' min value must be non-negative, "
-                    f"got: {min_val}"
-                )
-            if max_val < 0:
-                raise ValueError(
-                    f"'{coeff_type}' max value must be non-negative, "
-                    f"got: {max_val}"
-                )
-            if min_val > max_val:
-                raise ValueError(
-                    f"'{coeff_type}' min value must be <= max value, "
-                    f"got: {min_val} > {max_val}"
-                )
-            
-            # Validar estrategia (opcional, por defecto "linear_decreasing")
-            strategy = "linear_decreasing"  # Valor por defecto
-            if len(coeff_value) > 2:
-                if not isinstance(coeff_value[2], str):
-                    raise ValueError(
-                        f"'{coeff_type}' strategy must be a string, "
-                        f"got: {type(coeff_value[2])}"
-                    )
-            
-            return [min_val, max_val, strategy]
+        key = tuple(coeff_value) if isinstance(coeff_value, list) else coeff_value
+        try:
+            hash(key)
+        except TypeError:
+            # Valor no hashable: se valida sin caché
+            return _parse_coefficient.__wrapped__(coeff_value, coeff_type)
         
-        # Caso 3: Formato no soportado
-        raise ValueError(
-            f"'{coeff_type}' must be a number or list [min, max, strategy], "
-            f"got: {type(coeff_value)}"
-        )
+        validated = _parse_coefficient(key, coeff_type)
+        # Copia del resultado en caché para que nadie lo modifique
+        return list(validated) if isinstance(validated, list) else validated
@@ -1,13 +1,100 @@
 """Validador de estrategias de inercia con dependencia de parámetros básicos."""
 
+from functools import lru_cache
 from typing import Dict, Any, Union, List, Tuple
 import logging
 
-from src.main.algorithm.inertia.inertia_factory import get_inertia_strategy
 from src.main.config.validation.pipeline.registry import validator
 from src.main.config.validation.base_validator import BaseValidator
 from src.main.config.validation.context import ValidationContext
 
+# Plantillas de los mensajes de error (se formatean solo al lanzar el error)
+_ERR_DEPENDENCY = "Inertia validator requires basic_parameters to be validated first"
+_ERR_STRATEGY = "Failed to create inertia strategy: {error}"
+_ERR_RANGE = "Inertia {what} must be between {low} and {high}, got: {value}"
+_ERR_LIST_LENGTH = "Inertia list must have at least 2 elements [w_min, w_max], got: {length}"
+_ERR_NOT_NUMERIC = "Inertia min and max values must be numeric, got: {values}"
+_ERR_ORDER = "Inertia min value must be <= max value, got: {w_min} > {w_max}"
+_ERR_NOT_STRING = "Inertia strategy must be a string, got: {value_type}"
+_ERR_FORMAT = (
+    "Inertia type must be a number or list [w_min, w_max, strategy, ...], got: {value_type}"
+)
+
+
+@lru_cache(maxsize=128)
+def _parse_inertia(inertia_type: Any, min_inertia: float, 
+                   max_inertia: float) -> Union[float, List]:
+    """Valida el formato de inertia_type, con caché por valor.
+
+    Una misma configuración validada varias veces (por ejemplo, en un barrido 
+    de parámetros) no repite las conversiones ni las comprobaciones. El valor 
+    debe ser hashable (las listas se pasan como tuplas); los errores no se 
+    guardan en caché.
+
+    Args:
+        inertia_type: Valor del inertia_type a validar
+        min_inertia: Peso inercial mínimo admitido
+        max_inertia: Peso inercial máximo admitido
+
+    Returns:
+        Valor validado en formato apropiado (la lista devuelta es compartida 
+        entre llamadas y no debe modificarse)
+
+    Raises:
+        ValueError: Si el formato es inválido
+    """
+    # Caso 1: Valor constante
+    if isinstance(inertia_type, (int, float)):
+        value = float(inertia_type)
+        if not (min_inertia <= value <= max_inertia):
+            raise ValueError(_ERR_RANGE.format(
+                what="value", low=min_inertia, high=max_inertia, 
+                value=value
+            ))
+        return value
+    
+    # Caso 2: Lista/tupla con estrategia dinámica
+    if isinstance(inertia_type, (list, tuple)):
+        if len(inertia_type) < 2:
+            raise ValueError(_ERR_LIST_LENGTH.format(length=len(inertia_type)))
+        
+        # Validar valores mínimo y máximo
+        try:
+            w_min = float(inertia_type[0])
+            w_max = float(inertia_type[1])
+        except (ValueError, TypeError) as e:
+            raise ValueError(
+                _ERR_NOT_NUMERIC.format(values=list(inertia_type[:2]))
+            ) from e
+        
+        # Validar rangos
+        if not (min_inertia <= w_min <= max_inertia):
+            raise ValueError(_ERR_RANGE.format(
+                what="min value", low=min_inertia, high=max_inertia, 
+                value=w_min
+            ))
+        if not (min_inertia <= w_max <= max_inertia):
+            raise ValueError(_ERR_RANGE.format(
+                what="max value", low=min_inertia, high=max_inertia, 
+                value=w_max
+            ))
+        if w_min > w_max:
+            raise ValueError(_ERR_ORDER.format(w_min=w_min, w_max=w_max))
+        
+        # Validar estrategia (opcional, por defecto "linear_decreasing")
+        if len(inertia_type) > 2:
+            if not isinstance(inertia_type[2], str):
+                raise ValueError(
+                    _ERR_NOT_STRING.format(value_type=type(inertia_type[2]))
+                )
+            strategy = inertia_type[2].lower()
+        
+        # Los parámetros específicos se validan en la clase correspondiente
+        return list(inertia_type)
+    
+    # Caso 3: Formato no soportado
+    raise ValueError(_ERR_FORMAT.format(value_type=type(inertia_type)))
+
 
 @validator(dependencies=["basic_parameters"])
 class InertiaValidador(BaseValidator):
@@ -21,32 +108,34 @@ class InertiaValidador(BaseValidator):
     MIN_INERTIA = 0.2
     MAX_INERTIA = 0.9
     
-    def __init__(self):
-        super().__init__("inertia")
+    # Estrategia por defecto si no se indica inertia_type (tupla inmutable: 
+    # no se reconstruye en cada validación)
+    _DEFAULT_INERTIA = (MIN_INERTIA, MAX_INERTIA, "linear_decreasing")
+    
+    name = "inertia"
     
     def validate(self, config: Dict[str, Any], 
                  context: ValidationContext) -> None:
         """Valida la estrategia de inercia y sus parámetros."""
         # Verificar que las dependencias están satisfechas
         if context.generations is None:
-            raise ValueError(
-                "Inertia validator requires basic_parameters to be validated first"
-            )
+            raise ValueError(_ERR_DEPENDENCY)
         
         # Obtener inertia_type con valor por defecto
-        inertia_type = config.get(
-            'inertia_type', 
-            [self.MIN_INERTIA, self.MAX_INERTIA, "linear_decreasing"]
-        )
+        inertia_type = config.get('inertia_type')
+        if inertia_type is None:
+            inertia_type = self._DEFAULT_INERTIA
         
         # Validar formato del inertia_type
         validated_inertia = self._validate_inertia_format(inertia_type)
         
-        # Crear estrategia usando el factory
+        # Crear estrategia usando el factory (importación diferida: carga 
+        # NumPy y las estrategias)
+        from src.main.algorithm.inertia.inertia_factory import get_inertia_strategy
         try:
             strategy = get_inertia_strategy(validated_inertia)
         except Exception as e:
-            raise ValueError(f"Failed to create inertia strategy: {e}") from e
+            raise ValueError(_ERR_STRATEGY.format(error=e)) from e
         
         # Establecer en contexto
         context.inertia_strategy = strategy
@@ -64,65 +153,15 @@ class InertiaValidador(BaseValidator):
         Raises:
             ValueError: Si el formato es inválido
         """
-        # Caso 1: Valor constante
-        if isinstance(inertia_type, (int, float)):
-            value = float(inertia_type)
-            if not (self.MIN_INERTIA <= value <= self.MAX_INERTIA):
-                raise ValueError(
-                    f"Inertia value must be between {self.MIN_INERTIA} and "
-                    f"{self.MAX_INERTIA}, got: {value}"
-                )
-            return value
-        
-        # Caso 2: Lista/tupla con estrategia dinámica
-        if isinstance(inertia_type, (list, tuple)):
-            if len(inertia_type) < 2:
-                raise ValueError(
-                    f"Inertia list must have at least 2 elements [w_min, w_max], "
-                    f"got: {len(inertia_type)}"
-                )
-            
-            # Validar valores mínimo y máximo
-            try:
-                w_min = float(inertia_type[0])
-                w_max = float(inertia_type[1])
-            except (ValueError, TypeError) as e:
-                raise ValueError(
-                    f"Inertia min and max values must be numeric, "
-                    f"got: {inertia_type[:2]}"
-                ) from e
-            
-            # Validar rangos
-            if not (self.MIN_INERTIA <= w_min <= self.MAX_INERTIA):
-                raise ValueError(
-                    f"Inertia min value must be between {self.MIN_INERTIA} and "
-                    f"{self.MAX_INERTIA}, got: {w_min}"
-                )
-            if not (self.MIN_INERTIA <= w_max <= self.MAX_INERTIA):
-                raise ValueError(
-                    f"Inertia max value must be between {self.MIN_INERTIA} and "
-                    f"{self.MAX_INERTIA}, got: {w_max}"
-                )
-            if w_min > w_max:
-                raise ValueError(
-                    f"Inertia min value must be <= max value, "
-                    f"got: {w_min} > {w_max}"
-                )
-            
-            # Validar estrategia (opcional, por defecto "linear_decreasing")
-            if len(inertia_type) > 2:
-                if not isinstance(inertia_type[2], str):
-                    raise ValueError(
-                        f"Inertia strategy must be a string, "
-                        f"got: {type(inertia_type[2])}"
-                    )
-                strategy = inertia_type[2].lower()
-            
-            # Los parámetros específicos se validan en la clase correspondiente
-            return list(inertia_type)
+        key = tuple(inertia_type) if isinstance(inertia_type, list) else inertia_type
+        try:
+            hash(key)
+        except TypeError:
+            # Valor no hashable (p. ej. parámetros en listas): sin caché
+            return _parse_inertia.__wrapped__(
+                inertia_type, self.MIN_INERTIA, self.MAX_INERTIA
+            )
         
-        # Caso 3: Formato no soportado
-        raise ValueError(
-            f"Inertia type must be a number or list [w_min, w_max, strategy, ...], "
-            f"got: {type(inertia_type)}"
-        )
+        validated = _parse_inertia(key, self.MIN_INERTIA, self.MAX_INERTIA)
+        # Copia del resultado en caché para que nadie lo modifique
+        return list(validated) if isinstance(validated, list) else validated
@@ -1,6 +1,7 @@
 ﻿"""Validador de configuración de salida y directorios según formato JSON."""
 
 import os
+import stat
 from typing import Dict, Any
 from datetime import datetime
 
@@ -23,8 +24,7 @@ class OutputResultsValidador(BaseValidator):
     No depende de otros validadores.
     """
     
-    def __init__(self):
-        super().__init__("output")
+    name = "output"
     
     def validate(self, config: Dict[str, Any], 
                  context: ValidationContext) -> None:
@@ -57,13 +57,17 @@ class OutputResultsValidador(BaseValidator):
         # Normalizar el path
         base_output_path = os.path.normpath(base_output_path.strip())
         
-        # Crear el directorio si no existe
+        # Crear el directorio si no existe (un solo stat resuelve existencia 
+        # y tipo en el caso habitual de un directorio ya existente)
         try:
-            if not os.path.exists(base_output_path):
+            try:
+                mode = os.stat(base_output_path).st_mode
+            except FileNotFoundError:
                 os.makedirs(base_output_path, exist_ok=True)
+                mode = os.stat(base_output_path).st_mode
             
             # Verificar que es un directorio
-            if not os.path.isdir(base_output_path):
+            if not stat.S_ISDIR(mode):
                 raise ValueError(
                     f"'base_output_path' exists but is not a directory: "
                     f"{base_output_path}"
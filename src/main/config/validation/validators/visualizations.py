@@ -22,8 +22,7 @@ class VisualizationValidador(BaseValidator):
     Depende de: basic_parameters
     """
     
-    def __init__(self):
-        super().__init__("visualization")
+    name = "visualization"
     
     def validate(self, config: Dict[str, Any], 
                  context: ValidationContext) -> None:
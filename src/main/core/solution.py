@@ -8,7 +8,8 @@ import numpy as np
 class Solution:
     """Clase para representar la mejor solución encontrada por el algoritmo PSO.
     
-    Almacena la posición, velocidad y el valor de fitness.
+    Almacena la posición y el valor de fitness y, opcionalmente, la velocidad 
+    (PSO no la registra, ya que nunca se consulta).
     """
 
     def __init__(
@@ -23,13 +24,11 @@ class Solution:
             position (np.ndarray): Vector de posición de la solución.
             fitness (float): Valor de aptitud asociado.
             velocity (Optional[np.ndarray], optional): Vector de velocidad de la 
-                partícula. Defaults to None.
+                partícula, o None si no se registra. Defaults to None.
         """
         self.position = np.copy(position)
         self.fitness = fitness
-        self.velocity = (
-            np.copy(velocity) if velocity is not None else np.zeros_like(position)
-        )
+        self.velocity = np.copy(velocity) if velocity is not None else None
 
     def to_dict(self) -> Dict[str, Any]:
         """Convierte la solución a un diccionario.
@@ -59,6 +58,8 @@ class Solution:
             str: Cadena que describe la solución.
         """
         position_str = np.array2string(self.position, precision=6, separator=", ")
+        if self.velocity is None:
+            return f"Solution(fitness={self.fitness:.6f}, position={position_str})"
         velocity_str = np.array2string(self.velocity, precision=6, separator=", ")
         return (f"Solution(fitness={self.fitness:.6f}, position={position_str}, "
                 f"velocity={velocity_str})")
@@ -76,5 +77,8 @@ class Solution:
         return cls(
             position=np.array(data["position"]),
             fitness=data["fitness"],
-            velocity=np.array(data["velocity"]) if "velocity" in data else None,
+            velocity=(
+                np.array(data["velocity"]) 
+                if data.get("velocity") is not None else None
+            ),
         )
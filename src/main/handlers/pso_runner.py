@@ -1,6 +1,9 @@
 """Ejecutor PSO."""
 
-from typing import Any, Dict, Tuple
+import random
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Any, Dict, Iterator, Tuple
 
 import numpy as np
 from tqdm import tqdm
@@ -11,6 +14,23 @@ from src.main.handlers.graphics_handler import GraphicsHandler
 from src.main.utils.saver import save_results
 
 
+def run_one(seed: int, config: Dict[str, Any]) -> Dict[str, Any]:
+    """Ejecuta una única vez el algoritmo PSO con una semilla dada.
+
+    Es una función de módulo para poder ejecutarse en un pool de procesos.
+
+    Args:
+        seed: Semilla para los generadores aleatorios de la ejecución.
+        config: Configuración ya validada.
+
+    Returns:
+        Estadísticas de la ejecución.
+    """
+    np.random.seed(seed)
+    random.seed(seed)
+    return PSO(config=config, show_progress=False, seed=seed).run()
+
+
 class PSORunner:
     """Ejecutor de algoritmos PSO con validación."""
 
@@ -119,6 +139,28 @@ class PSORunner:
 
         return stats
 
+    def _iter_runs(self, num_runs: int) -> Iterator[Dict[str, Any]]:
+        """Genera las estadísticas de cada ejecución en orden.
+
+        Con 'workers' > 1 las ejecuciones, que son independientes, se 
+        reparten entre un pool de procesos, cada una con su propia semilla.
+
+        Args:
+            num_runs: Número de ejecuciones a realizar
+
+        Yields:
+            Estadísticas de cada ejecución
+        """
+        workers = min(self.config.get("workers", 1), num_runs)
+        if workers <= 1:
+            for _ in range(num_runs):
+                yield self._run_single(is_only_one_run=False)
+            return
+
+        seeds = np.random.SeedSequence().generate_state(num_runs).tolist()
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            yield from executor.map(partial(run_one, config=self.config), seeds)
+
     def _run_multiple(self, num_runs: int) -> None:
         """Ejecuta el algoritmo PSO múltiples veces.
 
@@ -134,8 +176,7 @@ class PSORunner:
         best_fitness_per_run, avg_fitness_per_run = [], []
         all_avg_fitness_history = []
 
-        for run in range(num_runs):
-            stats = self._run_single(is_only_one_run=False)
+        for run, stats in enumerate(self._iter_runs(num_runs)):
             self.all_stats.append(stats)
 
             # Actualizar estadísticas
@@ -26,7 +26,7 @@ class Particles2DPlot(BasePlot):
             Datos específicos para esta visualización
         """
         return {
-            "particles": data.get("pso_algorithm").particles,
+            "swarm": data.get("pso_algorithm").swarm,
             "bounds": data.get("config").get("bounds"),
             "benchmark_function": data.get("benchmark_function")
         }
@@ -41,7 +41,7 @@ class Particles2DPlot(BasePlot):
         Returns:
             Tupla (figura, eje) con la visualización generada
         """
-        particles = data.get('particles')
+        swarm = data.get('swarm')
         bounds = data.get('bounds')
         benchmark_function = data.get('benchmark_function')
 
@@ -62,21 +62,22 @@ class Particles2DPlot(BasePlot):
         contour = self.ax.contourf(X, Y, Z, 50, cmap="viridis", alpha=0.7)
         plt.colorbar(contour, ax=self.ax, label="Valor de la función")
 
-        # Extraer posiciones de partículas
-        positions = np.array([p.position for p in particles])
-        best_positions = np.array([p.best_position for p in particles])
+        # Dibujar las partículas si el enjambre ya fue inicializado
+        if swarm is not None:
+            positions = swarm.to_host(swarm.positions)
+            best_positions = swarm.to_host(swarm.best_positions)
 
-        # Dibujar posiciones actuales
-        self.ax.scatter(
-            positions[:, 0], positions[:, 1], c="white", edgecolor="black",
-            s=60, label="Posición actual"
-        )
+            # Dibujar posiciones actuales
+            self.ax.scatter(
+                positions[:, 0], positions[:, 1], c="white", edgecolor="black",
+                s=60, label="Posición actual"
+            )
 
-        # Dibujar mejores posiciones
-        self.ax.scatter(
-            best_positions[:, 0], best_positions[:, 1], c="red", edgecolor="black",
-            s=40, label="Mejor posición"
-        )
+            # Dibujar mejores posiciones
+            self.ax.scatter(
+                best_positions[:, 0], best_positions[:, 1], c="red", edgecolor="black",
+                s=40, label="Mejor posición"
+            )
 
         # Dibujar óptimo global si está disponible
         if hasattr(benchmark_function, "global_optimum_position"):
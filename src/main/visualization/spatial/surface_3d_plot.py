@@ -33,12 +33,12 @@ class Surface3DPlot(BasePlot):
         Returns:
             Datos específicos para esta visualización
         """
-        particles = data["pso_algorithm"].particles
+        swarm = data["pso_algorithm"].swarm
         
         return {
             "bounds": data.get("config").get("bounds"),
             "benchmark_function": data.get("benchmark_function"),
-            "particles": particles
+            "swarm": swarm
         }
     
     def _create_plot(self, data: Dict[str, Any], **kwargs) -> tuple:
@@ -53,7 +53,7 @@ class Surface3DPlot(BasePlot):
         """
         bounds = data.get('bounds', (-10, 10))
         benchmark_function = data.get('benchmark_function')
-        particles = data.get('particles', [])
+        swarm = data.get('swarm')
         
         if not benchmark_function:
             self.ax.text(0.5, 0.5, "No hay datos disponibles", 
@@ -82,10 +82,10 @@ class Surface3DPlot(BasePlot):
         plt.colorbar(surf, ax=self.ax, shrink=0.5, aspect=5, label="Valor de la función")
         
         # Mostrar partículas en superficie si están disponibles
-        if particles and len(particles) > 0:
-            if particles[0].dimensions == 2:
-                positions = np.array([p.position for p in particles])
-                fitness = np.array([p.fitness for p in particles])
+        if swarm is not None:
+            if swarm.dimensions == 2:
+                positions = swarm.to_host(swarm.positions)
+                fitness = swarm.to_host(swarm.fitness)
                 
                 self.ax.scatter(positions[:, 0], positions[:, 1], fitness, 
                               c='red', s=50, marker='o', label="Partículas")
@@ -102,7 +102,7 @@ class Surface3DPlot(BasePlot):
         self.ax.set_ylabel("x[1]")
         self.ax.set_zlabel("f(x)")
         
-        if particles:
+        if swarm is not None:
             self.ax.legend()
         
         return self.fig, self.ax